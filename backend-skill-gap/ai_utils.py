@@ -1,20 +1,26 @@
 import google.generativeai as genai
+import pandas as pd
 import requests
-from github import Github
+from github import GithubException
 import os
 import json
 import re
 from bs4 import BeautifulSoup
 import base64
 import time
+import copy
 import threading
+from functools import lru_cache
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
 
 # ---------------- API Keys ---------------- #
 # ---------------- API Keys from OS Environment ---------------- #
-from internship_data import (
-    get_trending_skills,
-    get_high_stipend_skills,
-)
+from internship_data import get_role_stats, get_skill_resolver
+from github_cache import ANALYSIS_CACHE, BLOB_CACHE, SingleFlight
+from github_client import BLOB, GITHUB_SCHEDULER, METADATA, GitHubRateLimited, get_github_client
+from local_repo import LocalRepository, open_local_repository
+from framework_detectors import DETECTORS, MANIFEST_FILES
 
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 GITHUB_TOKEN   = os.getenv("GITHUB_TOKEN")
@@ -36,711 +42,900 @@ if not GITHUB_TOKEN:
 
 
 # ===================== SKILL CANONICALIZATION SYSTEM ===================== #
-# Maps lowercase skill names to their canonical (properly formatted) versions
-
-CANONICAL_SKILL_NAMES = {
-    # Programming Languages
-    "javascript": "JavaScript",
-    "js": "JavaScript",
-    "typescript": "TypeScript",
-    "ts": "TypeScript",
-    "python": "Python",
-    "java": "Java",
-    "c++": "C++",
-    "cpp": "C++",
-    "c#": "C#",
-    "csharp": "C#",
-    "c": "C",
-    "go": "Go",
-    "golang": "Go",
-    "rust": "Rust",
-    "ruby": "Ruby",
-    "php": "PHP",
-    "swift": "Swift",
-    "kotlin": "Kotlin",
-    "scala": "Scala",
-    "r": "R",
-    "perl": "Perl",
-    "dart": "Dart",
-    "lua": "Lua",
-    "shell": "Shell",
-    "bash": "Bash",
-    "powershell": "PowerShell",
-    
-    # Web Technologies
-    "html": "HTML",
-    "html5": "HTML",
-    "css": "CSS",
-    "css3": "CSS",
-    "sass": "Sass",
-    "scss": "SCSS",
-    "less": "Less",
-    
-    # Frontend Frameworks
-    "react": "React",
-    "reactjs": "React",
-    "react.js": "React",
-    "vue": "Vue",
-    "vuejs": "Vue",
-    "vue.js": "Vue",
-    "angular": "Angular",
-    "angularjs": "Angular",
-    "svelte": "Svelte",
-    "next": "Next.js",
-    "nextjs": "Next.js",
-    "next.js": "Next.js",
-    "nuxt": "Nuxt.js",
-    "nuxtjs": "Nuxt.js",
-    "nuxt.js": "Nuxt.js",
-    "gatsby": "Gatsby",
-    "ember": "Ember.js",
-    "emberjs": "Ember.js",
-    
-    # CSS Frameworks
-    "tailwind": "Tailwind CSS",
-    "tailwindcss": "Tailwind CSS",
-    "tailwind css": "Tailwind CSS",
-    "bootstrap": "Bootstrap",
-    "bulma": "Bulma",
-    "materialize": "Materialize",
-    "material-ui": "Material-UI",
-    "materialui": "Material-UI",
-    "mui": "Material-UI",
-    "chakra": "Chakra UI",
-    "chakra ui": "Chakra UI",
-    "chakraui": "Chakra UI",
-    "styled-components": "Styled Components",
-    "styled components": "Styled Components",
-    
-    # Backend Frameworks
-    "node": "Node.js",
-    "nodejs": "Node.js",
-    "node.js": "Node.js",
-    "express": "Express",
-    "expressjs": "Express",
-    "express.js": "Express",
-    "django": "Django",
-    "flask": "Flask",
-    "fastapi": "FastAPI",
-    "spring": "Spring",
-    "springboot": "Spring Boot",
-    "spring boot": "Spring Boot",
-    "rails": "Ruby on Rails",
-    "ruby on rails": "Ruby on Rails",
-    "ror": "Ruby on Rails",
-    "laravel": "Laravel",
-    "symfony": "Symfony",
-    "asp.net": "ASP.NET",
-    "aspnet": "ASP.NET",
-    ".net": ".NET",
-    "dotnet": ".NET",
-    "nestjs": "NestJS",
-    "nest.js": "NestJS",
-    "koa": "Koa",
-    "hapi": "Hapi",
-    
-    # Mobile Development
-    "react native": "React Native",
-    "reactnative": "React Native",
-    "react-native": "React Native",
-    "flutter": "Flutter",
-    "ionic": "Ionic",
-    "xamarin": "Xamarin",
-    "android": "Android",
-    "ios": "iOS",
-    
-    # Databases
-    "mysql": "MySQL",
-    "postgresql": "PostgreSQL",
-    "postgres": "PostgreSQL",
-    "mongodb": "MongoDB",
-    "mongo": "MongoDB",
-    "redis": "Redis",
-    "sqlite": "SQLite",
-    "oracle": "Oracle",
-    "sql server": "SQL Server",
-    "mssql": "SQL Server",
-    "mariadb": "MariaDB",
-    "cassandra": "Cassandra",
-    "couchdb": "CouchDB",
-    "dynamodb": "DynamoDB",
-    "firebase": "Firebase",
-    "firestore": "Firestore",
-    "neo4j": "Neo4j",
-    "elasticsearch": "Elasticsearch",
-    "sql": "SQL",
-    "nosql": "NoSQL",
-    
-    # ORMs
-    "mongoose": "Mongoose",
-    "sequelize": "Sequelize",
-    "prisma": "Prisma",
-    "sqlalchemy": "SQLAlchemy",
-    "typeorm": "TypeORM",
-    "hibernate": "Hibernate",
-    
-    # Cloud & DevOps
-    "aws": "AWS",
-    "amazon web services": "AWS",
-    "azure": "Azure",
-    "gcp": "GCP",
-    "google cloud": "GCP",
-    "google cloud platform": "GCP",
-    "docker": "Docker",
-    "kubernetes": "Kubernetes",
-    "k8s": "Kubernetes",
-    "jenkins": "Jenkins",
-    "circleci": "CircleCI",
-    "travis": "Travis CI",
-    "travisci": "Travis CI",
-    "github actions": "GitHub Actions",
-    "gitlab ci": "GitLab CI",
-    "terraform": "Terraform",
-    "ansible": "Ansible",
-    "nginx": "Nginx",
-    "apache": "Apache",
-    "linux": "Linux",
-    "ubuntu": "Ubuntu",
-    "heroku": "Heroku",
-    "vercel": "Vercel",
-    "netlify": "Netlify",
-    "digitalocean": "DigitalOcean",
-    
-    # Version Control
-    "git": "Git",
-    "github": "GitHub",
-    "gitlab": "GitLab",
-    "bitbucket": "Bitbucket",
-    "svn": "SVN",
-    
-    # Testing
-    "jest": "Jest",
-    "mocha": "Mocha",
-    "chai": "Chai",
-    "jasmine": "Jasmine",
-    "cypress": "Cypress",
-    "selenium": "Selenium",
-    "puppeteer": "Puppeteer",
-    "playwright": "Playwright",
-    "pytest": "Pytest",
-    "unittest": "unittest",
-    "junit": "JUnit",
-    "rspec": "RSpec",
-    
-    # Data Science & ML
-    "tensorflow": "TensorFlow",
-    "pytorch": "PyTorch",
-    "keras": "Keras",
-    "scikit-learn": "Scikit-learn",
-    "sklearn": "Scikit-learn",
-    "pandas": "Pandas",
-    "numpy": "NumPy",
-    "matplotlib": "Matplotlib",
-    "seaborn": "Seaborn",
-    "jupyter": "Jupyter",
-    "opencv": "OpenCV",
-    "nltk": "NLTK",
-    "spacy": "SpaCy",
-    
-    # API & Protocols
-    "rest": "REST",
-    "restful": "REST",
-    "graphql": "GraphQL",
-    "grpc": "gRPC",
-    "websocket": "WebSocket",
-    "websockets": "WebSocket",
-    "soap": "SOAP",
-    
-    # Other Tools
-    "webpack": "Webpack",
-    "babel": "Babel",
-    "vite": "Vite",
-    "rollup": "Rollup",
-    "parcel": "Parcel",
-    "gulp": "Gulp",
-    "grunt": "Grunt",
-    "npm": "npm",
-    "yarn": "Yarn",
-    "pnpm": "pnpm",
-    "redux": "Redux",
-    "mobx": "MobX",
-    "zustand": "Zustand",
-    "recoil": "Recoil",
-    "rxjs": "RxJS",
-    "socket.io": "Socket.IO",
-    "socketio": "Socket.IO",
-    "jwt": "JWT",
-    "oauth": "OAuth",
-    "oauth2": "OAuth 2.0",
-    "stripe": "Stripe",
-    "twilio": "Twilio",
-    "sendgrid": "SendGrid",
-    "figma": "Figma",
-    "sketch": "Sketch",
-    "adobe xd": "Adobe XD",
-    "photoshop": "Photoshop",
-    "illustrator": "Illustrator",
-    "jira": "Jira",
-    "confluence": "Confluence",
-    "slack": "Slack",
-    "trello": "Trello",
-    "notion": "Notion",
-    "agile": "Agile",
-    "scrum": "Scrum",
-    "kanban": "Kanban",
-}
-
-
-def normalize_skill_name(skill_name):
-    """Normalize skill names for case-insensitive comparison"""
-    if not skill_name:
-        return ""
-    return skill_name.strip().lower()
-
-
-def canonicalize_skill_name(skill_name):
-    """
-    Convert a skill name to its canonical (properly formatted) version.
-    E.g., 'html' -> 'HTML', 'react' -> 'React', 'javascript' -> 'JavaScript'
-    """
-    if not skill_name:
-        return skill_name
-    
-    normalized = normalize_skill_name(skill_name)
-    
-    # Check if we have a canonical name for this skill
-    if normalized in CANONICAL_SKILL_NAMES:
-        return CANONICAL_SKILL_NAMES[normalized]
-    
-    # If not in our dictionary, apply smart capitalization
-    # Keep all uppercase if it looks like an acronym (2-4 chars, all letters)
-    if len(skill_name) <= 4 and skill_name.isalpha():
-        return skill_name.upper()
-    
-    # Title case for other skills
-    return skill_name.strip().title()
-
+# The taxonomy itself lives in skill_taxonomy.json, compiled and hot-reloaded by
+# skill_taxonomy (the internships dataset uses it too)
+from skill_taxonomy import (
+    normalize_skill_name,
+    canonicalize_skill_name,
+    load_taxonomy,
+    SkillLookup,
+    SkillResolver,
+)
 
-def find_skill_key(skills_dict, target_skill):
-    """Find a skill key in dictionary (case-insensitive)"""
-    target_normalized = normalize_skill_name(target_skill)
-    for key in skills_dict.keys():
-        if normalize_skill_name(key) == target_normalized:
-            return key
-    return None
+_taxonomy_resolver = None
 
 
-def skills_match(skill1, skill2):
-    """Check if two skill names match (case-insensitive, handles variations)"""
-    norm1 = normalize_skill_name(skill1)
-    norm2 = normalize_skill_name(skill2)
-    
-    # Direct match
-    if norm1 == norm2:
-        return True
-    
-    # Check if they canonicalize to the same thing
-    canon1 = normalize_skill_name(canonicalize_skill_name(skill1))
-    canon2 = normalize_skill_name(canonicalize_skill_name(skill2))
-    
-    if canon1 == canon2:
-        return True
-    
-    # Check partial matches for compound names
-    if norm1 in norm2 or norm2 in norm1:
-        return True
-    
-    return False
+def resolve_skill_name(skill_name):
+    """
+    Canonical name for free-text skill input, tolerant of spelling variants
+    ('reactjs', 'React.js', 'react js' -> 'React'). Uses the internships
+    vocabulary too when the dataset is available.
+    """
+    global _taxonomy_resolver
+    try:
+        resolver = get_skill_resolver()
+    except (OSError, ValueError, pd.errors.ParserError) as e:
+        # Missing, malformed or half-written CSV: the taxonomy alone still resolves
+        resolver = _taxonomy_resolver
+        if resolver is None:
+            print(f"⚠️ Internships dataset unavailable, resolving skills by taxonomy only: {e}")
+        if resolver is None or resolver.taxonomy_version != load_taxonomy().version:
+            resolver = _taxonomy_resolver = SkillResolver()
+    return resolver.canonicalize(skill_name)
 
 
 # ===================== SKILL DEPENDENCY GRAPH WITH DIFFICULTY-BASED BOOST ===================== #
+# Dependencies and their boost factors are part of skill_taxonomy.json
 
-SKILL_DEPENDENCIES = {
-    # Frontend Frameworks → Core Skills (with difficulty-based boosts)
-    "React": {
-        "dependencies": {
-            "JavaScript": 0.60,
-            "HTML": 0.90,
-            "CSS": 0.85
-        }
-    },
-    "Vue": {
-        "dependencies": {
-            "JavaScript": 0.60,
-            "HTML": 0.90,
-            "CSS": 0.85
-        }
-    },
-    "Angular": {
-        "dependencies": {
-            "JavaScript": 0.55,
-            "TypeScript": 0.70,
-            "HTML": 0.90,
-            "CSS": 0.85
-        }
-    },
-    "Next.js": {
-        "dependencies": {
-            "React": 0.75,
-            "JavaScript": 0.60,
-            "HTML": 0.90,
-            "CSS": 0.85
-        }
-    },
-    "Svelte": {
-        "dependencies": {
-            "JavaScript": 0.60,
-            "HTML": 0.90,
-            "CSS": 0.85
-        }
-    },
-    
-    # Backend Frameworks → Core Skills
-    "Django": {
-        "dependencies": {
-            "Python": 0.70
-        }
-    },
-    "Flask": {
-        "dependencies": {
-            "Python": 0.75
-        }
-    },
-    "FastAPI": {
-        "dependencies": {
-            "Python": 0.75
-        }
-    },
-    "Express": {
-        "dependencies": {
-            "JavaScript": 0.70,
-            "Node.js": 0.80
-        }
-    },
-    "Spring": {
-        "dependencies": {
-            "Java": 0.65
-        }
-    },
-    "Spring Boot": {
-        "dependencies": {
-            "Java": 0.65,
-            "Spring": 0.75
-        }
-    },
-    
-    # Mobile Development
-    "React Native": {
-        "dependencies": {
-            "React": 0.80,
-            "JavaScript": 0.65
-        }
-    },
-    "Flutter": {
-        "dependencies": {
-            "Dart": 0.75
-        }
-    },
-    "Swift": {
-        "dependencies": {
-            "iOS": 0.80
-        }
-    },
-    "Kotlin": {
-        "dependencies": {
-            "Java": 0.60,
-            "Android": 0.80
-        }
-    },
-    
-    # TypeScript → JavaScript
-    "TypeScript": {
-        "dependencies": {
-            "JavaScript": 0.85
-        }
-    },
-    
-    # Node.js → JavaScript
-    "Node.js": {
-        "dependencies": {
-            "JavaScript": 0.80
-        }
-    },
-    
-    # CSS Frameworks/Tools
-    "Sass": {
-        "dependencies": {
-            "CSS": 0.85
-        }
-    },
-    "SCSS": {
-        "dependencies": {
-            "CSS": 0.85
-        }
-    },
-    "Tailwind CSS": {
-        "dependencies": {
-            "CSS": 0.80,
-            "HTML": 0.90
-        }
-    },
-    "Bootstrap": {
-        "dependencies": {
-            "CSS": 0.85,
-            "HTML": 0.90
-        }
-    },
-    
-    # Testing Frameworks
-    "Jest": {
-        "dependencies": {
-            "JavaScript": 0.55
-        }
-    },
-    "Pytest": {
-        "dependencies": {
-            "Python": 0.55
-        }
-    },
-    "Mocha": {
-        "dependencies": {
-            "JavaScript": 0.55
-        }
-    },
-    
-    # Data Science / ML
-    "TensorFlow": {
-        "dependencies": {
-            "Python": 0.65
-        }
-    },
-    "PyTorch": {
-        "dependencies": {
-            "Python": 0.65
-        }
-    },
-    "Pandas": {
-        "dependencies": {
-            "Python": 0.75
-        }
-    },
-    "NumPy": {
-        "dependencies": {
-            "Python": 0.75
-        }
-    },
-    
-    # Databases with ORMs
-    "Mongoose": {
-        "dependencies": {
-            "MongoDB": 0.80,
-            "JavaScript": 0.65
-        }
-    },
-    "SQLAlchemy": {
-        "dependencies": {
-            "Python": 0.70,
-            "SQL": 0.75
-        }
-    },
-    
-    # DevOps
-    "Docker": {
-        "dependencies": {
-            "Linux": 0.65
-        }
-    },
-    "Kubernetes": {
-        "dependencies": {
-            "Docker": 0.75,
-            "Linux": 0.60
-        }
-    }
-}
+class BoostContext:
+    """
+    Taxonomy lookups for dependency boosts, memoized so the portfolios of a
+    bulk run share them: canonical names and graph nodes of skill names
+    (students mostly list the same skills) and the propagation order of
+    each distinct set of starting nodes.
+    """
+
+    def __init__(self, taxonomy=None):
+        taxonomy = taxonomy or load_taxonomy()
+        self.graph = taxonomy.dependency_graph
+        self.canonical_name = lru_cache(maxsize=None)(taxonomy.canonicalize)
+        self.node_for = lru_cache(maxsize=None)(self.graph.node_for)
+        self._orders = {}
 
+    def propagation_order(self, start_nodes):
+        key = frozenset(start_nodes)
+        order = self._orders.get(key)
+        if order is None:
+            order = self._orders[key] = self.graph.propagation_order(key)
+        return order
 
-def apply_skill_dependency_boost(skills_data):
+
+def apply_skill_dependency_boost(skills_data, verbose=True, context=None):
     """
     Apply skill dependency graph logic with DIFFICULTY-BASED BOOSTS.
+    Boosts propagate transitively along the taxonomy's dependency graph.
     """
-    
-    print("\n🔗 Applying Skill Dependency Graph (Difficulty-Based)...")
+    log = print if verbose else (lambda *args, **kwargs: None)
+    context = context or BoostContext()
+    graph = context.graph
+
+    log("\n🔗 Applying Skill Dependency Graph (Difficulty-Based)...")
     
     boosted_skills = {}
     
     # First pass: Copy all existing skills with canonical names
     for skill_name, skill_data in skills_data.items():
         if skill_name not in ["extra_skills_found"]:
-            canonical_name = canonicalize_skill_name(skill_name)
+            canonical_name = context.canonical_name(skill_name)
             boosted_skills[canonical_name] = skill_data.copy()
     
-    # Second pass: Apply dependency boosts (case-insensitive matching)
-    for parent_skill, parent_data in list(boosted_skills.items()):
-        # Find parent skill in dependency graph (case-insensitive)
-        parent_key = None
-        for dep_key in SKILL_DEPENDENCIES.keys():
-            if skills_match(dep_key, parent_skill):
-                parent_key = dep_key
-                break
-        
-        if parent_key:
-            parent_proficiency = parent_data.get("ai_proficiency", 0)
-            
-            if parent_proficiency > 0:
-                dependencies = SKILL_DEPENDENCIES[parent_key]["dependencies"]
-                
-                print(f"  📊 {parent_skill} (prof: {parent_proficiency}) → boosting dependencies")
-                
-                for dep_skill, boost_percentage in dependencies.items():
-                    # Find the dependency skill in boosted_skills (case-insensitive)
-                    dep_key_found = None
-                    for existing_key in boosted_skills.keys():
-                        if skills_match(existing_key, dep_skill):
-                            dep_key_found = existing_key
-                            break
-                    
-                    minimum_proficiency = int(parent_proficiency * boost_percentage)
-                    
-                    # Use canonical name if creating new skill
-                    if not dep_key_found:
-                        dep_key_found = canonicalize_skill_name(dep_skill)
-                        boosted_skills[dep_key_found] = {
-                            "total_bytes": 0,
-                            "project_count": 0,
-                            "projects": [],
-                            "ai_proficiency": 0,
-                            "ai_reasoning": "Inferred from parent skill"
-                        }
-                    
-                    # Apply boost if current proficiency is lower
-                    current_prof = boosted_skills[dep_key_found].get("ai_proficiency", 0)
-                    
-                    if minimum_proficiency > current_prof:
-                        old_prof = current_prof
-                        boosted_skills[dep_key_found]["ai_proficiency"] = minimum_proficiency
-                        boosted_skills[dep_key_found]["ai_reasoning"] = (
-                            f"Boosted from {parent_skill} (difficulty factor: {boost_percentage}) - "
-                            f"was {old_prof}, now {minimum_proficiency}"
-                        )
-                        print(f"    ✅ {dep_key_found}: {old_prof} → {minimum_proficiency} "
-                              f"(boost: {int(boost_percentage*100)}%)")
-                    else:
-                        print(f"    ⏭️  {dep_key_found}: {current_prof} (already sufficient)")
-    
+    # Proficiency each graph node starts with, from the skills the student has
+    node_proficiency = {}
+    node_source = {}
+    for skill_name, skill_data in boosted_skills.items():
+        node = context.node_for(skill_name)
+        proficiency = skill_data.get("ai_proficiency", 0)
+        if node is not None and proficiency > node_proficiency.get(node, 0):
+            node_proficiency[node] = proficiency
+            node_source[node] = skill_name
+
+    # Second pass: push boosts through the graph, parents before dependencies
+    existing_skills = SkillLookup(boosted_skills.keys())
+    for node in context.propagation_order(node_proficiency):
+        parent_proficiency = node_proficiency.get(node, 0)
+        if parent_proficiency <= 0 or not graph.children[node]:
+            continue
+
+        parent_skill = node_source[node]
+        log(f"  📊 {parent_skill} (prof: {parent_proficiency}) → boosting dependencies")
+
+        for dep_node, boost_percentage in graph.children[node]:
+            dep_skill = graph.names[dep_node]
+
+            # Find the dependency skill in boosted_skills (case-insensitive)
+            dep_key_found = existing_skills.find(dep_skill)
+
+            minimum_proficiency = int(parent_proficiency * boost_percentage)
+
+            # Use canonical name if creating new skill
+            if not dep_key_found:
+                dep_key_found = dep_skill
+                existing_skills.add(dep_key_found)
+                boosted_skills[dep_key_found] = {
+                    "total_bytes": 0,
+                    "project_count": 0,
+                    "projects": [],
+                    "ai_proficiency": 0,
+                    "ai_reasoning": "Inferred from parent skill"
+                }
+
+            # Apply boost if current proficiency is lower
+            current_prof = boosted_skills[dep_key_found].get("ai_proficiency", 0)
+
+            if minimum_proficiency > current_prof:
+                old_prof = current_prof
+                boosted_skills[dep_key_found]["ai_proficiency"] = minimum_proficiency
+                boosted_skills[dep_key_found]["ai_reasoning"] = (
+                    f"Boosted from {parent_skill} (difficulty factor: {boost_percentage}) - "
+                    f"was {old_prof}, now {minimum_proficiency}"
+                )
+                log(f"    ✅ {dep_key_found}: {old_prof} → {minimum_proficiency} "
+                    f"(boost: {int(boost_percentage*100)}%)")
+            else:
+                log(f"    ⏭️  {dep_key_found}: {current_prof} (already sufficient)")
+
+            # The dependency now passes its (possibly boosted) level on
+            dep_proficiency = boosted_skills[dep_key_found].get("ai_proficiency", 0)
+            if dep_proficiency > node_proficiency.get(dep_node, 0):
+                node_proficiency[dep_node] = dep_proficiency
+                node_source[dep_node] = dep_key_found
+
     return boosted_skills
 
 
+def apply_skill_dependency_boost_bulk(skills_maps):
+    """
+    Apply dependency boosts to many students' skill maps at once: one
+    taxonomy version and one BoostContext for the whole batch, without the
+    per-skill logging.
+    """
+    context = BoostContext()
+    return [apply_skill_dependency_boost(skills, verbose=False, context=context) for skills in skills_maps]
+
+
+# ===================== GITHUB REPOSITORY SCAN ===================== #
+
+MAX_SCAN = 80                 # source files read by the framework detectors
+ROOT_SAMPLE_ENTRIES = 10      # top-level entries considered for code samples
+SAMPLE_MAX_SIZE = 50000       # skip larger files when sampling
+MAX_SCAN_SIZE = 1000000       # skip larger manifests / source files (the contents API capped at 1 MB)
+SAMPLE_CHARS = 500
+SCAN_SKIP_DIRS = {"node_modules", "dist", "build", ".next", "public"}
+
+# Blob downloads run on one shared pool; each repository keeps at most
+# GITHUB_REPO_CONCURRENCY of them in flight and stops collecting at its deadline
+GITHUB_FETCH_WORKERS = int(os.getenv("GITHUB_FETCH_WORKERS", "16"))
+GITHUB_REPO_CONCURRENCY = int(os.getenv("GITHUB_REPO_CONCURRENCY", "8"))
+GITHUB_SCAN_DEADLINE = float(os.getenv("GITHUB_SCAN_DEADLINE_SECONDS", "20"))
+
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_COMPARE_MAX_FILES = 300     # GitHub lists at most this many files per compare
+
+_blob_pool = ThreadPoolExecutor(max_workers=GITHUB_FETCH_WORKERS, thread_name_prefix="github-blob")
+
+
+def repo_call(repo, priority, fn, *args, **kwargs):
+    """Call a repository method: through the GitHub scheduler, or directly for a LocalRepository."""
+    if isinstance(repo, LocalRepository):
+        return fn(*args, **kwargs)
+    return GITHUB_SCHEDULER.call(priority, fn, *args, **kwargs)
+
+
+def fetch_repo_tree(repo, ref=None):
+    """
+    Every file in the repository (at `ref`, default branch if None) from ONE
+    recursive git-tree request, as GitTreeElements (path, type, size, sha)
+    in tree order. Directories are walked locally instead of with a
+    get_contents call each.
+    """
+    try:
+        tree = repo_call(repo, METADATA, repo.get_git_tree, ref or repo.default_branch, recursive=True)
+    except GithubException as e:
+        # 409: empty repository (no commits yet)
+        if e.status == 409:
+            return []
+        raise
+    if tree.raw_data.get("truncated"):
+        print(f"⚠️ {repo.full_name}: tree listing truncated by GitHub, scanning the listed part")
+    return tree.tree
+
+
+def select_scan_files(tree):
+    """
+    Pick the blobs worth downloading from a recursive tree listing:
+      - samples: small files among the first ROOT_SAMPLE_ENTRIES top-level entries
+      - detect:  dependency manifests (MANIFEST_FILES) and up to MAX_SCAN source
+                 files with an extension some framework detector reads,
+                 outside SCAN_SKIP_DIRS, in traversal order; blobs larger
+                 than MAX_SCAN_SIZE are skipped
+    """
+    samples = []
+    detect = []
+    code_extensions = DETECTORS.code_extensions
+    root_entries = 0
+    scanned = 0
+
+    for entry in tree:
+        parts = entry.path.split("/")
+        if len(parts) == 1:
+            root_entries += 1
+            if root_entries <= ROOT_SAMPLE_ENTRIES and entry.type == "blob" and (entry.size or 0) < SAMPLE_MAX_SIZE:
+                samples.append(entry)
+
+        if entry.type != "blob" or any(p.lower() in SCAN_SKIP_DIRS for p in parts[:-1]):
+            continue
+        if (entry.size or 0) > MAX_SCAN_SIZE:
+            continue
+        name = parts[-1]
+        if name in MANIFEST_FILES:
+            detect.append(entry)
+        elif name.lower().endswith(code_extensions) and scanned < MAX_SCAN:
+            scanned += 1
+            detect.append(entry)
+
+    return samples, detect
+
+
+def fetch_blob_text(repo, sha):
+    """Decoded text of one git blob."""
+    blob = repo_call(repo, BLOB, repo.get_git_blob, sha)
+    if blob.encoding == "base64":
+        return base64.b64decode(blob.content).decode("utf-8", "ignore")
+    return blob.content or ""
+
+
+def scan_blob_text(text):
+    """
+    What the analysis needs from one file's content, computed once per blob
+    SHA and cached (BLOB_CACHE): the code sample prefix, the framework
+    detector signals (one pass over the text, see framework_detectors) and
+    the size in bytes.
+    """
+    return {
+        "sample": text[:SAMPLE_CHARS],
+        "signals": DETECTORS.scan(text),
+        "size": len(text.encode("utf-8")),
+    }
+
+
+def scan_blobs(repo, shas, deadline=None, cancel=None):
+    """
+    {sha: scan_blob_text result} for the blobs `shas`. Blobs already in
+    BLOB_CACHE (from any repository) are neither downloaded nor scanned again.
+    """
+    shas = list(dict.fromkeys(shas))
+    scans = BLOB_CACHE.get_many(shas)
+    missing = [sha for sha in shas if sha not in scans]
+    for sha, text in fetch_blobs(repo, missing, deadline, cancel=cancel).items():
+        scans[sha] = scan_blob_text(text)
+        BLOB_CACHE.put(sha, scans[sha])
+    return scans
+
+
+def fetch_blobs(repo, shas, deadline=None, concurrency=GITHUB_REPO_CONCURRENCY, cancel=None):
+    """
+    Download the blobs `shas` concurrently on the shared pool, keeping
+    at most `concurrency` requests in flight for this repository.
+
+    Returns {sha: text} for every blob that arrived before `deadline` (a
+    time.monotonic() value, default GITHUB_SCAN_DEADLINE from now). Failed
+    blobs are skipped; downloads still running at the deadline (or once the
+    `cancel` event is set) are abandoned, and queued ones are never started.
+    Once the scheduler refuses blob downloads (quota low) nothing more is queued.
+    """
+    if deadline is None:
+        deadline = time.monotonic() + GITHUB_SCAN_DEADLINE
+
+    queue = iter(list(dict.fromkeys(shas)))
+    texts = {}
+    pending = {}
+    exhausted = False
+    rate_limited = False
+
+    while True:
+        while not exhausted and len(pending) < concurrency:
+            sha = next(queue, None)
+            if sha is None:
+                exhausted = True
+                break
+            pending[_blob_pool.submit(fetch_blob_text, repo, sha)] = sha
+        if not pending:
+            break
+
+        remaining = deadline - time.monotonic()
+        if cancel is not None and cancel.is_set():
+            remaining = 0
+        done = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED).done if remaining > 0 else set()
+        if not done:
+            skipped = len(pending) + sum(1 for _ in queue)
+            print(f"⏱️ {repo.full_name}: scan deadline reached, {skipped} file(s) skipped")
+            for future in pending:
+                future.cancel()
+            break
+
+        for future in done:
+            sha = pending.pop(future)
+            try:
+                texts[sha] = future.result()
+            except GitHubRateLimited as e:
+                if not rate_limited:
+                    print(f"⏳ {repo.full_name}: {e}, remaining files skipped")
+                rate_limited = exhausted = True
+            except Exception as e:
+                print(f"⚠️ {repo.full_name}: could not fetch blob {sha[:10]}: {e}")
+
+    return texts
+
+
 # ===================== MAIN FUNCTION ===================== #
 
-def analyze_github_with_ai(github_url):
+# Profile links (github.com/<user>) analyze the user's best repositories at once
+GITHUB_PROFILE_MAX_REPOS = int(os.getenv("GITHUB_PROFILE_MAX_REPOS", "5"))
+GITHUB_PROFILE_CANDIDATES = 30     # most recently pushed repos considered for ranking
+GITHUB_PROFILE_RECENT_DAYS = 365
+GITHUB_PROFILE_DEADLINE = float(os.getenv("GITHUB_PROFILE_DEADLINE_SECONDS", "40"))
+
+# Separate from the blob pool: repo scans wait on blob downloads
+_repo_pool = ThreadPoolExecutor(max_workers=GITHUB_PROFILE_MAX_REPOS, thread_name_prefix="github-repo")
+
+
+def parse_github_url(github_url):
+    """
+    (owner, repo_name) from a GitHub link; repo_name is None for profile links.
+    Accepts 'https://github.com/alice/app', 'github.com/alice/app.git',
+    'https://github.com/alice/app/tree/main/src' and 'https://github.com/alice'.
+    """
+    path = re.split(r"[?#]", github_url.strip())[0]
+    path = re.sub(r"^(https?://)?(www\.)?github\.com/", "", path, flags=re.IGNORECASE)
+    parts = [p for p in path.split("/") if p]
+    if not parts:
+        raise ValueError(f"Not a GitHub link: {github_url}")
+    repo_name = parts[1] if len(parts) > 1 else None
+    if repo_name and repo_name.endswith(".git"):
+        repo_name = repo_name[:-4]
+    return parts[0], repo_name
+
+
+def fetch_repo_metadata(repo):
+    """(language bytes, project card) of a repository."""
+    languages = repo_call(repo, METADATA, repo.get_languages)
+
+    # Store basic project data
+    project = {
+        "name": repo.name,
+        "description": repo.description or "No description",
+        "url": repo.html_url,
+        "stars": repo.stargazers_count,
+        "forks": repo.forks_count,
+        "languages": list(languages.keys()),
+        "topics": repo_call(repo, METADATA, repo.get_topics),
+        "updated": str(repo.updated_at)
+    }
+    return languages, project
+
+
+def file_record(sha, scan, size, detect, sample):
+    """One scanned file in the evidence's file index."""
+    return {
+        "sha": sha,
+        "size": size,
+        "signals": scan["signals"],
+        "detect": detect,
+        "sample": scan["sample"] if sample else None,
+    }
+
+
+def collect_repo_evidence(repo, deadline=None, cancel=None, ref=None):
+    """
+    Everything the skill analysis learns from one repository (files at
+    `ref`, default branch if None), before AI scoring: language bytes and
+    detected frameworks (skills_evidence), the project card and a few code
+    samples. `complete` is False if some files could not be read in time.
+    """
+    if deadline is None:
+        deadline = time.monotonic() + GITHUB_SCAN_DEADLINE
+
+    languages, project = fetch_repo_metadata(repo)
+
+    # One recursive tree listing, then only the selected blobs are fetched
+    complete = True
     try:
-        g = Github(GITHUB_TOKEN)
+        tree = fetch_repo_tree(repo, ref)
+    except Exception as e:
+        print(f"⚠️ Could not list repository files: {e}")
+        tree = []
+        complete = False
+    sample_files, detect_files = select_scan_files(tree)
+
+    # Scan every selected blob (fetched concurrently unless already cached)
+    scans = scan_blobs(repo, [e.sha for e in sample_files + detect_files], deadline, cancel)
+    complete = complete and len(scans) == len({e.sha for e in sample_files + detect_files})
+
+    sample_paths = {entry.path for entry in sample_files}
+    detect_paths = {entry.path for entry in detect_files}
+    files = {}
+    for entry in sample_files + detect_files:
+        if entry.sha in scans and entry.path not in files:
+            files[entry.path] = file_record(
+                entry.sha, scans[entry.sha], entry.size or 0, entry.path in detect_paths, entry.path in sample_paths
+            )
 
-        # Extract data from URL
-        url = github_url.rstrip("/").split("/")
-        owner, repo_name = url[-2], url[-1]
+    return build_repo_evidence(repo.name, languages, project, files, complete)
 
-        repo = g.get_repo(f"{owner}/{repo_name}")
-        print(f"\n🔍 Scanning repository: {owner}/{repo_name}")
 
-        skills_evidence = {}
-        projects = []
-        code_samples = {}
-
-        languages = repo.get_languages()
-
-        # Store basic project data
-        projects.append({
-            "name": repo.name,
-            "description": repo.description or "No description",
-            "url": repo.html_url,
-            "stars": repo.stargazers_count,
-            "forks": repo.forks_count,
-            "languages": list(languages.keys()),
-            "topics": repo.get_topics(),
-            "updated": str(repo.updated_at)
+def build_repo_evidence(repo_name, languages, project, files, complete):
+    """
+    Repository evidence from its language bytes, project card and file
+    index ({path: file_record}); the file index is kept in the evidence so
+    a later commit can be analyzed from the diff (update_repo_evidence).
+    """
+    skills_evidence = {}
+    code_samples = {}
+
+    # Mark language usage for skill confidence (with canonical names)
+    for lang, size in languages.items():
+        canonical_lang = canonicalize_skill_name(lang)
+        skills_evidence.setdefault(canonical_lang, {
+            "total_bytes": 0, "project_count": 0, "projects": []
         })
+        skills_evidence[canonical_lang]["total_bytes"] += size
+        skills_evidence[canonical_lang]["project_count"] += 1
+        skills_evidence[canonical_lang]["projects"].append(repo_name)
 
-        # Mark language usage for skill confidence (with canonical names)
-        for lang, size in languages.items():
-            canonical_lang = canonicalize_skill_name(lang)
-            skills_evidence.setdefault(canonical_lang, {
-                "total_bytes": 0, "project_count": 0, "projects": []
-            })
-            skills_evidence[canonical_lang]["total_bytes"] += size
-            skills_evidence[canonical_lang]["project_count"] += 1
-            skills_evidence[canonical_lang]["projects"].append(repo.name)
+    # Paths sort in git tree order, so samples and reasons follow the tree
+    ordered = sorted(files.items())
+
+    # FAST FILE SAMPLE COLLECTION
+    for path, record in ordered:
+        if record["sample"] is None:
+            continue
+        ext = path.split(".")[-1]
+        code_samples.setdefault(ext, []).append({"file": path, "code": record["sample"]})
+
+    # FRAMEWORK DETECTION: bytes and files using each detected framework
+    frameworks = {}
+    for path, record in ordered:
+        if not record["detect"]:
+            continue
+        for detector, reason in DETECTORS.matches(path, record["signals"]):
+            found = frameworks.setdefault(detector.name, {"total_bytes": 0, "file_count": 0, "reason": reason})
+            found["total_bytes"] += record["size"]
+            found["file_count"] += 1
+
+    for name, found in frameworks.items():
+        if name in skills_evidence:
+            # Also a GitHub language (e.g. Vue): keep its byte count
+            skills_evidence[name]["file_count"] = found["file_count"]
+            continue
+        skills_evidence[name] = {
+            "total_bytes": found["total_bytes"], "file_count": found["file_count"],
+            "project_count": 1, "projects": [repo_name],
+            "ai_proficiency": 50, "ai_reasoning": found["reason"],
+        }
+
+    return {
+        "skills_evidence": skills_evidence,
+        "project": project,
+        "code_samples": code_samples,
+        "files": files,
+        "complete": complete,
+    }
 
-        # FAST FILE SAMPLE COLLECTION
+
+def update_repo_evidence(repo, base, base_sha, head_sha, deadline=None, cancel=None):
+    """
+    Evidence at `head_sha` from `base` (complete evidence at `base_sha`) and
+    the compare diff between the two commits: only added and modified files
+    are downloaded and scanned, everything else (renamed files included) is
+    taken from the base.
+
+    If files were only modified below the root, the same files stay
+    selected and no listing is needed. Otherwise (files added, removed or
+    renamed, or a root file changed) the tree is listed again and the
+    selection redone exactly as in a full scan.
+
+    Returns None when the diff cannot be applied (history rewritten, more
+    changed files than GitHub lists, or a modified file grew past
+    MAX_SCAN_SIZE and would drop out of the selection); the caller then
+    crawls the repository.
+    """
+    if deadline is None:
+        deadline = time.monotonic() + GITHUB_SCAN_DEADLINE
+
+    comparison = repo_call(repo, METADATA, repo.compare, base_sha, head_sha)
+    changes = comparison.files
+    if comparison.status != "ahead" or len(changes) >= GITHUB_COMPARE_MAX_FILES:
+        return None
+
+    languages, project = fetch_repo_metadata(repo)
+    files = base["files"]
+    complete = True
+
+    # path -> (blob sha, size or None if unknown, detect, sample) of the selected files
+    selected = {}
+    relist = any(change.status != "modified" or "/" not in change.filename for change in changes)
+    if relist:
         try:
-            contents = repo.get_contents("")
-            for c in contents[:10]:
-                if c.type == "file" and c.size < 50000:
-                    ext = c.name.split(".")[-1]
-                    code = base64.b64decode(c.content).decode("utf-8", "ignore")[:500]
-                    code_samples.setdefault(ext, []).append({"file": c.name, "code": code})
-        except:
-            pass
-
-        # 🚀 FULL WORKING REACT DETECTOR
-        MAX_SCAN = 80
-        counter = 0
-
-        def mark_react(reason):
-            skills_evidence.setdefault("React", {
-                "total_bytes": 15000, "project_count": 0, "projects": [repo.name],
-                "ai_proficiency": 50, "ai_reasoning": reason
-            })
-            skills_evidence["React"]["project_count"] += 1
+            tree = fetch_repo_tree(repo, head_sha)
+        except Exception as e:
+            print(f"⚠️ Could not list repository files: {e}")
+            tree = []
+            complete = False
+        sample_files, detect_files = select_scan_files(tree)
+        for entry in sample_files + detect_files:
+            selected[entry.path] = (entry.sha, entry.size or 0, False, False)
+        for entry in detect_files:
+            selected[entry.path] = (entry.sha, entry.size or 0, True, False)
+        for entry in sample_files:
+            sha, size, detect, _ = selected[entry.path]
+            selected[entry.path] = (sha, size, detect, True)
+    else:
+        changed = {change.filename: change.sha for change in changes}
+        for path, record in files.items():
+            if path in changed:
+                selected[path] = (changed[path], None, record["detect"], record["sample"] is not None)
+            else:
+                selected[path] = (record["sha"], record["size"], record["detect"], record["sample"] is not None)
+
+    # A renamed or copied file keeps its blob sha, so its base record is reused too
+    by_sha = {}
+    for record in files.values():
+        if by_sha.get(record["sha"], {}).get("sample") is None:
+            by_sha[record["sha"]] = record
+
+    def reusable(path, sha, sample):
+        """The base record for `path` at blob `sha`, or None if it must be scanned."""
+        record = files.get(path)
+        if record is None or record["sha"] != sha:
+            record = by_sha.get(sha)
+        if record is None or (sample and record["sample"] is None):
+            return None
+        return record
+
+    rescan = [sha for path, (sha, _, _, sample) in selected.items() if reusable(path, sha, sample) is None]
+    scans = scan_blobs(repo, rescan, deadline, cancel)
+
+    updated = {}
+    for path, (sha, size, detect, sample) in selected.items():
+        record = reusable(path, sha, sample)
+        if record is not None:
+            updated[path] = {**record, "detect": detect, "sample": record["sample"] if sample else None}
+            continue
+        scan = scans.get(sha)
+        if scan is None:
+            complete = False
+            continue
+        if size is None:
+            size = scan["size"]
+            if size > MAX_SCAN_SIZE:
+                return None
+            # Like in a full scan, a sample file that grew too big is left out
+            sample = sample and size < SAMPLE_MAX_SIZE
+        updated[path] = file_record(sha, scan, size, detect, sample)
 
-        def scan(path=""):
-            nonlocal counter
-            if counter > MAX_SCAN:
-                return
+    print(f"🔁 {repo.full_name}: {len(changes)} changed file(s) since {base_sha[:10]}, "
+          f"{len(set(rescan))} file(s) rescanned")
+    return build_repo_evidence(repo.name, languages, project, updated, complete)
 
-            try:
-                files = repo.get_contents(path)
-                for f in files:
-                    if f.type == "dir" and f.name.lower() in ["node_modules", "dist", "build", ".next", "public"]:
-                        continue
 
-                    if f.type == "file" and f.name.endswith((".jsx", ".js", ".tsx")):
-                        code = base64.b64decode(f.content).decode("utf-8", "ignore").lower()
-                        counter += 1
-                        if "import react" in code or "from 'react'" in code or "usestate" in code or "useeffect" in code:
-                            mark_react("React components/hooks detected")
+# Relative change in a skill's bytes / files / projects that makes new AI scoring worthwhile
+GITHUB_REANALYSIS_THRESHOLD = float(os.getenv("GITHUB_REANALYSIS_THRESHOLD", "0.10"))
 
-                    if f.type == "file" and f.name == "package.json":
-                        data = base64.b64decode(f.content).decode("utf-8", "ignore").lower()
-                        if "react" in data:
-                            mark_react("React found in package.json")
+_evidence_flight = SingleFlight()
+_analysis_flight = SingleFlight()
 
-                    if f.type == "dir" and counter < MAX_SCAN:
-                        scan(f.path)
 
-            except:
-                pass
+def resolve_head_sha(full_name):
+    """
+    Current default-branch head commit of `owner/repo` (None for an empty
+    repository). Sent as a conditional request with the ETag of the last
+    lookup, so an unchanged repository costs a 304 and no rate limit.
+    Raises GitHubRateLimited when the quota is used up.
+    """
+    ref = ANALYSIS_CACHE.get_ref(full_name)
+    headers = {"Accept": "application/vnd.github.sha"}
+    if GITHUB_TOKEN:
+        headers["Authorization"] = f"token {GITHUB_TOKEN}"
+    if ref and ref.get("etag"):
+        headers["If-None-Match"] = ref["etag"]
+
+    GITHUB_SCHEDULER.acquire(METADATA)
+    resp = requests.get(f"{GITHUB_API_URL}/repos/{full_name}/commits/HEAD", headers=headers, timeout=10)
+    GITHUB_SCHEDULER.observe_headers(resp.headers)
+    if resp.status_code in (403, 429) and resp.headers.get("X-RateLimit-Remaining") == "0":
+        reset = resp.headers.get("X-RateLimit-Reset")
+        raise GitHubRateLimited("GitHub API rate limit exceeded", float(reset) if reset else None)
+    if resp.status_code == 304 and ref:
+        return ref["sha"]
+    if resp.status_code == 409:
+        return None
+    resp.raise_for_status()
+    sha = resp.text.strip()
+    ANALYSIS_CACHE.put_ref(full_name, sha, resp.headers.get("ETag"))
+    return sha
+
+
+def get_repo_evidence(g, full_name, repo=None, deadline=None, cancel=None):
+    """
+    collect_repo_evidence through the persistent cache: evidence is stored
+    under owner/repo@head_sha, so an unchanged repository is not crawled
+    again (not even get_repo is called). A repository that moved since its
+    last complete analysis is updated from the compare diff instead of
+    crawled (update_repo_evidence). Concurrent requests for the same
+    commit share one crawl. Evidence cut short by the deadline is not stored.
+    """
+    try:
+        sha = resolve_head_sha(full_name)
+    except GitHubRateLimited:
+        raise
+    except Exception as e:
+        print(f"⚠️ {full_name}: could not resolve head commit, analyzing without cache: {e}")
+        sha = None
+    if sha is None:
+        return collect_repo_evidence(repo or GITHUB_SCHEDULER.call(METADATA, g.get_repo, full_name), deadline, cancel)
+
+    key = f"{full_name}@{sha}"
+
+    def compute():
+        cached = ANALYSIS_CACHE.get_evidence(key)
+        if cached is not None:
+            print(f"♻️ Using cached analysis for {full_name}@{sha[:10]}")
+            return cached
+        repo_obj = repo or GITHUB_SCHEDULER.call(METADATA, g.get_repo, full_name)
+
+        evidence = None
+        latest = ANALYSIS_CACHE.get_latest(full_name)
+        if latest and latest["sha"] != sha:
+            base = ANALYSIS_CACHE.get_evidence(f"{full_name}@{latest['sha']}")
+            if base is not None:
+                try:
+                    evidence = update_repo_evidence(repo_obj, base, latest["sha"], sha, deadline, cancel)
+                except GitHubRateLimited:
+                    raise
+                except Exception as e:
+                    print(f"⚠️ {full_name}: could not analyze from the diff, rescanning: {e}")
+        if evidence is None:
+            evidence = collect_repo_evidence(repo_obj, deadline, cancel, ref=sha)
+
+        if evidence["complete"]:
+            ANALYSIS_CACHE.put_evidence(key, evidence)
+            ANALYSIS_CACHE.put_latest(full_name, sha)
+        return evidence
+
+    return _evidence_flight.do(key.lower(), compute)
+
+
+def merge_repo_evidence(collected):
+    """Combine collect_repo_evidence results: bytes and counts add up, lists concatenate."""
+    skills_evidence = {}
+    projects = []
+    code_samples = {}
+
+    for evidence in collected:
+        projects.append(evidence["project"])
+        for ext, samples in evidence["code_samples"].items():
+            code_samples.setdefault(ext, []).extend(samples)
+        for skill, data in evidence["skills_evidence"].items():
+            merged = skills_evidence.get(skill)
+            if merged is None:
+                skills_evidence[skill] = {**data, "projects": list(data["projects"])}
+                continue
+            merged["total_bytes"] += data["total_bytes"]
+            merged["project_count"] += data["project_count"]
+            if "file_count" in data:
+                merged["file_count"] = merged.get("file_count", 0) + data["file_count"]
+            merged["projects"].extend(p for p in data["projects"] if p not in merged["projects"])
+
+    return skills_evidence, projects, code_samples
+
+
+def _as_utc(moment):
+    if moment is None:
+        return datetime.min.replace(tzinfo=timezone.utc)
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+def rank_profile_repos(repos, limit=GITHUB_PROFILE_MAX_REPOS):
+    """
+    The repositories worth analyzing for a profile: non-empty ones, own
+    work before forks, recently pushed before stale, then the biggest.
+    """
+    recent = datetime.now(timezone.utc) - timedelta(days=GITHUB_PROFILE_RECENT_DAYS)
+    candidates = [r for r in repos if r.size]
+    candidates.sort(
+        key=lambda r: (not r.fork, _as_utc(r.pushed_at) >= recent, r.size, _as_utc(r.pushed_at)),
+        reverse=True,
+    )
+    return candidates[:limit]
+
+
+def collect_profile_evidence(g, owner):
+    """
+    Scan a user's top repositories concurrently within GITHUB_PROFILE_DEADLINE.
+    Repos still running at the deadline are cancelled and left out; the ones
+    that finished are returned in ranking order.
+    """
+    user = GITHUB_SCHEDULER.call(METADATA, g.get_user, owner)
+    listing = user.get_repos(type="owner", sort="pushed", direction="desc")
+    repos = rank_profile_repos(GITHUB_SCHEDULER.call(METADATA, list, listing[:GITHUB_PROFILE_CANDIDATES]))
+    print(f"\n🔍 Scanning profile: {owner} ({', '.join(r.name for r in repos) or 'no repositories'})")
+
+    deadline = time.monotonic() + GITHUB_PROFILE_DEADLINE
+    cancel = threading.Event()
+    futures = [
+        _repo_pool.submit(
+            get_repo_evidence, g, repo.full_name, repo,
+            min(deadline, time.monotonic() + GITHUB_SCAN_DEADLINE), cancel,
+        )
+        for repo in repos
+    ]
+    done, not_done = wait(futures, timeout=GITHUB_PROFILE_DEADLINE)
+    if not_done:
+        cancel.set()
+        for future in not_done:
+            future.cancel()
+        print(f"⏱️ {owner}: profile deadline reached, {len(not_done)} repo(s) skipped")
+
+    collected = []
+    for repo, future in zip(repos, futures):
+        if future not in done:
+            continue
+        try:
+            collected.append(future.result())
+        except Exception as e:
+            print(f"⚠️ Skipping {repo.full_name}: {e}")
+    return collected
+
+
+def analyze_github_with_ai(github_url):
+    """
+    Skill evidence and projects from a GitHub link: a single repository, or
+    a profile (github.com/<user>) whose top repositories are analyzed together.
+    Identical concurrent requests share one analysis. Raises GitHubRateLimited
+    when the GitHub quota is used up, so callers can tell "try later" from
+    "no skills found".
+    """
+    try:
+        # Extract data from URL
+        owner, repo_name = parse_github_url(github_url)
+        target = f"{owner}/{repo_name}" if repo_name else owner
+        results, projects = _analysis_flight.do(target.lower(), lambda: _analyze_github(owner, repo_name))
+        return copy.deepcopy(results), copy.deepcopy(projects)
+
+    except GitHubRateLimited as e:
+        resets = f", resets at {e.reset_time}" if e.reset_time else ""
+        print(f"⏳ GitHub rate limit reached, skipping GitHub analysis{resets}: {e}")
+        raise
+
+    except Exception as e:
+        print("❌ Error:", e)
+        return {}, []
+
+
+def _analyze_github(owner, repo_name):
+    """Body of analyze_github_with_ai; runs once per target at a time."""
+    g = get_github_client()
+
+    if repo_name:
+        print(f"\n🔍 Scanning repository: {owner}/{repo_name}")
+        collected = [get_repo_evidence(g, f"{owner}/{repo_name}")]
+    else:
+        collected = collect_profile_evidence(g, owner)
+
+    target = f"{owner}/{repo_name}" if repo_name else owner
+    return _score_evidence(collected, target)
 
-        scan()
-        print("React Detect:", skills_evidence.get("React", "❌ None found"))
 
-        # Send to Gemini
-        print("\n🤖 Running AI skill analysis...")
-        results = analyze_code_with_gemini(code_samples, skills_evidence)
+def evidence_changed_materially(before, after):
+    """
+    Whether new evidence ({"skills_evidence", "code_samples"}) could change
+    the AI scores: a skill appeared or disappeared, a skill's bytes, files
+    or projects moved by more than GITHUB_REANALYSIS_THRESHOLD, or the code
+    samples shown to Gemini changed.
+    """
+    old_skills, new_skills = before["skills_evidence"], after["skills_evidence"]
+    if set(old_skills) != set(new_skills):
+        return True
+    for skill, data in new_skills.items():
+        for field in ("total_bytes", "file_count", "project_count"):
+            old_value, new_value = old_skills[skill].get(field, 0), data.get(field, 0)
+            if abs(new_value - old_value) > GITHUB_REANALYSIS_THRESHOLD * max(old_value, new_value):
+                return True
+    return gemini_samples(before["code_samples"]) != gemini_samples(after["code_samples"])
+
+
+def _score_evidence(collected, target=None):
+    """
+    AI scoring of collected repository evidence (GitHub or local). With a
+    `target` (owner/repo or owner), the last AI scores are reused while the
+    evidence has not changed materially since they were computed; the
+    evidence figures (bytes, files, projects) are always the fresh ones.
+    """
+    skills_evidence, projects, code_samples = merge_repo_evidence(collected)
+    evidence = {"skills_evidence": skills_evidence, "code_samples": code_samples}
+    taxonomy_version = load_taxonomy().version
+
+    if target:
+        previous = ANALYSIS_CACHE.get_scores(target)
+        if (previous is not None and previous["taxonomy_version"] == taxonomy_version
+                and not evidence_changed_materially(previous["evidence"], evidence)):
+            print(f"♻️ {target}: evidence unchanged since the last AI analysis, reusing its scores")
+            results = with_previous_scores(skills_evidence, previous["scores"])
+            return apply_skill_dependency_boost(results), projects
+
+    print("React Detect:", skills_evidence.get("React", "❌ None found"))
+
+    # Send to Gemini
+    print("\n🤖 Running AI skill analysis...")
+    results = analyze_code_with_gemini(code_samples, skills_evidence)
+    # Fallback estimates are not kept: the next request asks Gemini again
+    ai_scored = any(
+        isinstance(data, dict) and data.get("ai_reasoning") != FALLBACK_REASONING for data in results.values()
+    )
+
+    if target and ai_scored:
+        # Gemini's scores before the dependency boost, which is redone on reuse
+        scores = {
+            skill: {"ai_proficiency": data["ai_proficiency"], "ai_reasoning": data["ai_reasoning"]}
+            for skill, data in results.items() if isinstance(data, dict)
+        }
+        ANALYSIS_CACHE.put_scores(target, {
+            "taxonomy_version": taxonomy_version, "evidence": evidence, "scores": scores,
+        })
 
-        # Apply dependency graph AFTER AI analysis
-        results = apply_skill_dependency_boost(results)
+    # Apply dependency graph AFTER AI analysis
+    return apply_skill_dependency_boost(results), projects
 
-        return results, projects
 
+def with_previous_scores(skills_evidence, scores):
+    """
+    analyze_code_with_gemini's result for `skills_evidence` built from
+    earlier AI scores (skill -> ai_proficiency / ai_reasoning) instead of
+    a new Gemini call.
+    """
+    results = {}
+    for skill, data in skills_evidence.items():
+        canonical_name = canonicalize_skill_name(skill)
+        results[canonical_name] = {**data, **scores.get(canonical_name, {})}
+        if "ai_proficiency" not in results[canonical_name]:
+            results[canonical_name]["ai_proficiency"] = calc(data)
+            results[canonical_name]["ai_reasoning"] = "Estimated size & usage"
+    results["extra_skills_found"] = [k for k in results if k not in ["React", "extra_skills_found"]]
+    return results
+
+
+def collect_local_evidence(path, deadline=None):
+    """collect_repo_evidence for a local checkout or tarball (no GitHub calls)."""
+    with open_local_repository(path) as repo:
+        print(f"\n🔍 Scanning local repository: {repo.name}")
+        return collect_repo_evidence(repo, deadline)
+
+
+def analyze_local_with_ai(paths):
+    """
+    analyze_github_with_ai for code on disk: `paths` is one or more local
+    repository directories (e.g. git clones) or tarballs, analyzed together
+    like the repositories of a profile. Same (skills, projects) result.
+    Only for trusted, server-side paths (benchmarks, archived submissions);
+    never pass user input straight through.
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+    try:
+        return _score_evidence([collect_local_evidence(path) for path in paths])
     except Exception as e:
         print("❌ Error:", e)
         return {}, []
 
 
 # ===================== GEMINI AI SKILL ANALYZER ===================== #
+def gemini_samples(code_samples):
+    """The part of the code samples sent to Gemini: the first file per extension, truncated."""
+    return {k: [{"file": d["file"], "code": d["code"][:200]} for d in v[:1]] for k, v in code_samples.items()}
+
+
 def analyze_code_with_gemini(code_samples, skills):
-    short_samples = {k: [{"file": d["file"], "code": d["code"][:200]} for d in v[:1]] for k, v in code_samples.items()}
+    short_samples = gemini_samples(code_samples)
     
     prompt = f"""
 Analyze and estimate skill proficiency based on code. 
@@ -779,12 +974,13 @@ Samples:{json.dumps(short_samples)}
 
     # Create new skills dict with canonical names
     canonical_skills = {}
+    parsed_lookup = SkillLookup(parsed.keys())
     for lang, data in skills.items():
         canonical_name = canonicalize_skill_name(lang)
         canonical_skills[canonical_name] = data.copy()
         
         # Case-insensitive matching with Gemini results
-        match = next((k for k in parsed if skills_match(k, lang)), None)
+        match = parsed_lookup.find(lang)
         if match:
             canonical_skills[canonical_name]["ai_proficiency"] = parsed[match].get("proficiency", 40)
             canonical_skills[canonical_name]["ai_reasoning"] = parsed[match].get("reason", "Detected through AI")
@@ -799,7 +995,12 @@ Samples:{json.dumps(short_samples)}
 
 # ===================== FALLBACK CALCULATIONS ===================== #
 def calc(d):
-    return min((d["project_count"] * 12) + (d["total_bytes"] // 9000), 75)
+    # Detected frameworks also count the files using them
+    usage = max(d["project_count"], d.get("file_count", 0))
+    return min((usage * 12) + (d["total_bytes"] // 9000), 75)
+
+
+FALLBACK_REASONING = "Auto fallback estimation"
 
 
 def fallback(sk):
@@ -808,7 +1009,7 @@ def fallback(sk):
         canonical_name = canonicalize_skill_name(k)
         canonical_skills[canonical_name] = v.copy()
         canonical_skills[canonical_name]["ai_proficiency"] = calc(v)
-        canonical_skills[canonical_name]["ai_reasoning"] = "Auto fallback estimation"
+        canonical_skills[canonical_name]["ai_reasoning"] = FALLBACK_REASONING
     return canonical_skills
 
 
@@ -857,6 +1058,7 @@ def generate_skill_proficiency_with_ai(user_skills, github_skills, user_projects
 
     # Track processed skills (normalized) to avoid duplicates
     processed_skills = set()
+    github_lookup = SkillLookup(github_skills_canonical.keys())
 
     # ================= USER CLAIMED SKILLS (CASE INSENSITIVE) =================
     for skill in user_skills:
@@ -878,11 +1080,7 @@ def generate_skill_proficiency_with_ai(user_skills, github_skills, user_projects
         }
 
         # Find match in github_skills (case-insensitive)
-        match_key = None
-        for gh_skill in github_skills_canonical.keys():
-            if skills_match(gh_skill, canonical_skill):
-                match_key = gh_skill
-                break
+        match_key = github_lookup.find(canonical_skill)
 
         if match_key and match_key in github_skills_canonical:
             g = github_skills_canonical[match_key]
@@ -967,8 +1165,10 @@ def generate_roadmap_with_courses(current_skills, target_role):
     canonical_skills = [canonicalize_skill_name(s) for s in current_skills]
 
     # 🔹 NEW: use your CSV to get skills for this role
-    trending = get_trending_skills(target_role=target_role, top_n=25)
-    high_value = get_high_stipend_skills(target_role=target_role, top_n=15)
+    # (RoleStats is cached per role, so get_industry_trends reuses it)
+    role_stats = get_role_stats(target_role)
+    trending = role_stats.trending(25, canonical=True)
+    high_value = role_stats.high_stipend_skills(15, canonical=True)
 
     try:
         model = genai.GenerativeModel("gemini-flash-latest")
@@ -1323,9 +1523,11 @@ def get_industry_trends(target_role):
     """
 
     try:
-        # From your CSV: top skills for this role
-        general = get_trending_skills(target_role=target_role, top_n=20)
-        high = get_high_stipend_skills(target_role=target_role, top_n=10)
+        # From your CSV: top skills for this role (same RoleStats as the roadmap)
+        role_stats = get_role_stats(target_role)
+        # Skill names come out canonical ("MS-Excel") from the dataset's table
+        general = role_stats.trending(20, canonical=True)
+        high = role_stats.high_stipend_skills(10, canonical=True)
 
         # If we have no data for this role, fall back to the static list you already had
         if not general:
@@ -1338,9 +1540,8 @@ def get_industry_trends(target_role):
 
         # Main list from general frequency
         for item in general:
-            raw_skill = item["skill"]        # lower‑case from CSV
+            skill = item["skill"]
             count = int(item["count"])
-            skill = canonicalize_skill_name(raw_skill)
 
             ratio = count / max_count
             if ratio >= 0.67:
@@ -1350,7 +1551,7 @@ def get_industry_trends(target_role):
             else:
                 trend_label = "stable"
 
-            high_count = int(high_counts.get(raw_skill, 0))
+            high_count = int(high_counts.get(skill, 0))
 
             desc = (
                 f"Required in {count} internships for "
@@ -1372,9 +1573,8 @@ def get_industry_trends(target_role):
         for item in high:
             if item["skill"] in general_skill_set:
                 continue
-            raw_skill = item["skill"]
+            skill = item["skill"]
             count = int(item["count"])
-            skill = canonicalize_skill_name(raw_skill)
             desc = (
                 f"Appears mainly in higher‑stipend internships for "
                 f"{target_role or 'this role'} in our dataset."
@@ -2,7 +2,8 @@ import os
 import json
 import tempfile
 import platform
-from fastapi import FastAPI, Request
+import secrets
+from fastapi import Depends, FastAPI, Header, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, FileResponse, HTMLResponse
 
@@ -15,9 +16,16 @@ from ai_utils import (
     find_job_opportunities,
     get_industry_trends,
     normalize_skill_name,
-    canonicalize_skill_name
+    canonicalize_skill_name,
+    resolve_skill_name,
 )
 
+from starlette.concurrency import run_in_threadpool
+
+from internship_data import get_query_cache_stats, reload_dataset
+from skill_taxonomy import SkillStatusMatcher, get_taxonomy_version, reload_taxonomy
+from github_cache import ANALYSIS_CACHE, BLOB_CACHE
+from github_client import GITHUB_SCHEDULER, GitHubRateLimited
 from utils import generate_resume_pdf, generate_portfolio_html, get_temp_directory
 
 app = FastAPI(title="AI Portfolio Analyzer")
@@ -34,7 +42,8 @@ app.add_middleware(
 def process_skills_input(skills_input):
     """
     Process skills input and return canonicalized unique skills list.
-    Handles case-insensitivity: 'html', 'HTML', 'Html' all become 'HTML'
+    Handles case-insensitivity: 'html', 'HTML', 'Html' all become 'HTML',
+    and spelling variants: 'reactjs', 'React.js', 'react js' all become 'React'
     """
     if isinstance(skills_input, list):
         raw_skills = [s.strip() for s in skills_input if s and s.strip()]
@@ -48,7 +57,7 @@ def process_skills_input(skills_input):
     canonical_skills = []
     
     for skill in raw_skills:
-        canonical = canonicalize_skill_name(skill)
+        canonical = resolve_skill_name(skill)
         normalized = normalize_skill_name(canonical)
         
         if normalized not in seen_normalized:
@@ -86,13 +95,21 @@ async def generate_portfolio(request: Request):
         # Step 1: Analyze GitHub profile with AI
         github_skills = {}
         github_projects = []
+        github_rate_limited = False
+        github_rate_limit_reset_at = None
         
         if github_link:
             try:
                 print("🔍 Analyzing GitHub profile with AI...")
-                github_skills, github_projects = analyze_github_with_ai(github_link)
+                # Blocking (GitHub + Gemini): run it off the event loop so concurrent
+                # requests for the same repository can share one analysis
+                github_skills, github_projects = await run_in_threadpool(analyze_github_with_ai, github_link)
                 print(f"✅ AI analysis complete: Found {len(github_skills)} skills")
                 print(f"📊 Skills detected: {list(github_skills.keys())}")
+            except GitHubRateLimited as e:
+                # The rest of the portfolio is still generated; the client can retry the GitHub part later
+                github_rate_limited = True
+                github_rate_limit_reset_at = e.reset_time
             except Exception as e:
                 print(f"⚠️ GitHub analysis error: {str(e)}")
         else:
@@ -136,62 +153,15 @@ async def generate_portfolio(request: Request):
         print("📈 Analyzing industry trends with AI...")
         trends = get_industry_trends(target_role)
         
-        # Get GitHub verified skills (normalized for comparison)
-        github_verified_normalized = set(
-            normalize_skill_name(s) for s in proficiency_analysis.get('github_verified_skills', [])
-        )
-        
-        # Get claimed but no evidence skills (normalized)
-        claimed_no_evidence_normalized = set(
-            normalize_skill_name(s) for s in proficiency_analysis.get('claimed_no_evidence_skills', [])
+        # Mark trends with proper status: index the student's skill sets once,
+        # then classify every trend against that index
+        status_matcher = SkillStatusMatcher(
+            github_skills.keys(),
+            user_skills,
+            proficiency_analysis.get('github_verified_skills', []),
+            proficiency_analysis.get('claimed_no_evidence_skills', []),
         )
-        
-        # All GitHub skills normalized
-        github_skills_normalized = set(normalize_skill_name(s) for s in github_skills.keys())
-        
-        # User skills normalized
-        user_skills_normalized = set(normalize_skill_name(s) for s in user_skills)
-        
-        # Mark trends with proper status
-        for trend in trends:
-            trend_normalized = normalize_skill_name(trend['skill'])
-            
-            # Check if skill matches any GitHub skill (case-insensitive)
-            is_in_github = any(
-                trend_normalized == gh_norm or trend_normalized in gh_norm or gh_norm in trend_normalized
-                for gh_norm in github_skills_normalized
-            )
-            
-            # Check if claimed by user
-            is_claimed = any(
-                trend_normalized == us_norm or trend_normalized in us_norm or us_norm in trend_normalized
-                for us_norm in user_skills_normalized
-            )
-            
-            # Check verification status
-            is_verified_in_github = any(
-                trend_normalized == v or trend_normalized in v or v in trend_normalized
-                for v in github_verified_normalized
-            )
-            
-            is_claimed_no_evidence = any(
-                trend_normalized == c or trend_normalized in c or c in trend_normalized
-                for c in claimed_no_evidence_normalized
-            )
-            
-            # Set status based on evidence
-            if is_verified_in_github or is_in_github:
-                trend['has_skill'] = True
-                trend['skill_status'] = 'verified'
-                trend['status_message'] = '✅ You already have this skill (verified in GitHub)'
-            elif is_claimed_no_evidence or (is_claimed and not is_in_github):
-                trend['has_skill'] = True
-                trend['skill_status'] = 'claimed_no_evidence'
-                trend['status_message'] = '⚠️ Claimed but no evidence found in GitHub'
-            else:
-                trend['has_skill'] = False
-                trend['skill_status'] = 'not_learned'
-                trend['status_message'] = '📚 Consider learning this skill'
+        status_matcher.mark_trends(trends)
         
         print(f"✅ Identified {len(trends)} trending skills")
         
@@ -207,6 +177,8 @@ async def generate_portfolio(request: Request):
             'intro_video_url': intro_video_url,
             'projects': user_projects,
             'github_projects': github_projects,
+            'github_rate_limited': github_rate_limited,
+            'github_rate_limit_reset_at': github_rate_limit_reset_at,
             'proficiency_analysis': proficiency_analysis,
             'roadmap': roadmap,
             'job_opportunities': jobs,
@@ -336,6 +308,46 @@ async def download_portfolio(request: Request):
         )
 
 
+def require_admin_token(x_admin_token: str | None = Header(default=None)):
+    """Admin endpoints need the X-Admin-Token header to match ADMIN_TOKEN (unset: disabled)."""
+    admin_token = os.getenv("ADMIN_TOKEN")
+    # Constant-time comparison, so response timing does not leak the token
+    if not admin_token or not secrets.compare_digest((x_admin_token or "").encode(), admin_token.encode()):
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+
+@app.post("/api/admin/reload-internships", dependencies=[Depends(require_admin_token)])
+async def reload_internships(request: Request):
+    """Reload internships.csv without restarting (appends new rows when possible)"""
+
+    try:
+        force = request.query_params.get("force", "").lower() in ("1", "true", "yes")
+        result = await run_in_threadpool(reload_dataset, force)
+        return JSONResponse(result)
+    except Exception as e:
+        print(f"❌ Internships reload error: {str(e)}")
+        return JSONResponse(
+            {"error": "Failed to reload internships", "message": str(e)},
+            status_code=500
+        )
+
+
+@app.post("/api/admin/reload-taxonomy", dependencies=[Depends(require_admin_token)])
+async def reload_skill_taxonomy(request: Request):
+    """Reload skill_taxonomy.json without restarting (the old version stays on errors)"""
+
+    try:
+        force = request.query_params.get("force", "").lower() in ("1", "true", "yes")
+        result = await run_in_threadpool(reload_taxonomy, force)
+        return JSONResponse(result)
+    except Exception as e:
+        print(f"❌ Skill taxonomy reload error: {str(e)}")
+        return JSONResponse(
+            {"error": "Failed to reload skill taxonomy", "message": str(e)},
+            status_code=500
+        )
+
+
 @app.get("/")
 async def root():
     return {"message": "AI Portfolio Analyzer API", "status": "running", "version": "2.3"}
@@ -343,7 +355,15 @@ async def root():
 
 @app.get("/health")
 async def health():
-    return {"status": "healthy", "ai_enabled": True}
+    return {
+        "status": "healthy",
+        "ai_enabled": True,
+        "internship_query_cache": get_query_cache_stats(),
+        "skill_taxonomy_version": get_taxonomy_version(),
+        "github_analysis_cache": ANALYSIS_CACHE.stats(),
+        "github_blob_cache": BLOB_CACHE.stats(),
+        "github_scheduler": GITHUB_SCHEDULER.stats(),
+    }
 
 
 if __name__ == "__main__":
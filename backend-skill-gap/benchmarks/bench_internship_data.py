@@ -0,0 +1,253 @@
+"""
+Benchmarks for the internships dataset layer (internship_data.py).
+
+Generates synthetic CSVs that follow the real internships.csv role / skill /
+stipend distributions, then for each size measures in a fresh process:
+  - cold load time from CSV, and load time from the on-disk snapshot
+  - peak RSS of the worker
+  - p50 / p99 latency of uncached role queries (role filter, skill counts,
+    trending + high-stipend) and of cached get_trending_skills calls
+
+Usage (from backend-skill-gap/):
+    python benchmarks/bench_internship_data.py
+    python benchmarks/bench_internship_data.py --sizes 10000 100000 1000000 5000000
+    python benchmarks/bench_internship_data.py --output results/main.json
+
+Results are written as JSON (one record per size, by default to
+benchmarks/internship_data_bench.json) so two runs can be diffed.
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, BACKEND_DIR)
+
+import internship_data  # noqa: E402
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+GENERATE_CHUNK_ROWS = 200_000
+
+# Share of generated rows whose skill list gets one skill swapped for a
+# frequency-weighted random skill, and whose role gets a synthetic variant,
+# so larger datasets also grow their vocabularies.
+SKILL_MUTATION_RATE = 0.10
+ROLE_VARIANT_RATE = 0.02
+
+
+def generate_csv(path: str, rows: int, seed: int = 42) -> None:
+    """
+    Write `rows` synthetic internships to `path`. Rows are resampled from the
+    real CSV (keeping the joint role / skills / stipend distribution), with a
+    small share of skills and roles perturbed.
+    """
+    rng = np.random.default_rng(seed)
+    real = pd.read_csv(internship_data.CSV_PATH, encoding="utf-8")
+    skill_lists = internship_data._parse_skills_column(real["Skills"])
+
+    vocab, counts = np.unique(
+        np.array([s for skills in skill_lists for s in skills], dtype=object),
+        return_counts=True,
+    )
+    weights = counts / counts.sum()
+
+    written = 0
+    first = True
+    while written < rows:
+        n = min(GENERATE_CHUNK_ROWS, rows - written)
+        picks = rng.integers(0, len(real), size=n)
+        chunk = real.iloc[picks].reset_index(drop=True)
+        picked_skills = skill_lists.iloc[picks].reset_index(drop=True)
+
+        mutate = np.flatnonzero(rng.random(n) < SKILL_MUTATION_RATE)
+        replacements = rng.choice(vocab, size=len(mutate), p=weights)
+        skills_col = chunk["Skills"].to_numpy(dtype=object)
+        for row, new_skill in zip(mutate, replacements):
+            skills = list(picked_skills[row]) or [new_skill]
+            skills[rng.integers(0, len(skills))] = new_skill
+            skills_col[row] = repr([s.title() for s in skills])
+        chunk["Skills"] = skills_col
+
+        variants = np.flatnonzero(rng.random(n) < ROLE_VARIANT_RATE)
+        roles = chunk["Role"].to_numpy(dtype=object)
+        roles[variants] = [
+            f"{roles[i]} - Track {rng.integers(0, max(10, rows // 1000))}" for i in variants
+        ]
+        chunk["Role"] = roles
+
+        chunk.to_csv(path, mode="w" if first else "a", header=first, index=False)
+        first = False
+        written += n
+
+
+def _percentiles(samples: list) -> dict:
+    ms = np.array(samples) * 1000
+    return {
+        "p50_ms": round(float(np.percentile(ms, 50)), 4),
+        "p99_ms": round(float(np.percentile(ms, 99)), 4),
+        "mean_ms": round(float(ms.mean()), 4),
+        "n": len(samples),
+    }
+
+
+def _timed(fn, *args):
+    started = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - started
+
+
+def _clear_caches(dataset) -> None:
+    dataset.role_index.matched_roles.cache_clear()
+    internship_data._QUERY_CACHE.clear()
+
+
+def run_worker(csv_path: str, queries: int, seed: int) -> dict:
+    """
+    Measurements for one dataset size; runs in its own process so that peak
+    RSS and cold-load numbers are not polluted by other sizes.
+    """
+    snapshot_path = csv_path + ".snapshot.pkl"
+    internship_data.CSV_PATH = csv_path
+    internship_data.SNAPSHOT_PATH = snapshot_path
+    internship_data._DATASET.check_seconds = -1
+    if os.path.exists(snapshot_path):
+        os.remove(snapshot_path)
+
+    load_csv_s = _timed(internship_data.load_dataset)
+    dataset = internship_data.load_dataset()
+
+    internship_data._DATASET.clear()
+    load_snapshot_s = _timed(internship_data.load_dataset)
+    dataset = internship_data.load_dataset()
+
+    # Query mix: the most common roles weighted by frequency, plus a few
+    # keywords and no-match inputs like the ones students type
+    rng = np.random.default_rng(seed)
+    role_counts = dataset.df["role_norm"].astype(str).value_counts()
+    top_roles = role_counts.index[:200].tolist()
+    role_weights = (role_counts.iloc[:200] / role_counts.iloc[:200].sum()).to_numpy()
+    keywords = ["web", "data", "python", "marketing", "c++ developer", "design", "", "zzz"]
+    targets = [
+        keywords[i % len(keywords)] if rng.random() < 0.3 else rng.choice(top_roles, p=role_weights)
+        for i in range(queries)
+    ]
+
+    timings = {"filter_by_role": [], "skill_frequency": [], "role_stats_uncached": [],
+               "trending_cached": []}
+
+    def uncached_role_stats(target):
+        stats = internship_data._compute_role_stats(dataset, target)
+        stats.trending(25)
+        stats.high_stipend_skills(15)
+
+    # internship_data prints a debug line per computed role; keep it out of the output
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for target in targets:
+            _clear_caches(dataset)
+            timings["filter_by_role"].append(
+                _timed(internship_data._filter_by_role, dataset, target))
+            key = internship_data._role_lookup_key(dataset, target)
+            rows = dataset.role_index.rows_matching(key)
+            timings["skill_frequency"].append(
+                _timed(internship_data._skill_frequency, dataset.skill_index, rows))
+
+            _clear_caches(dataset)
+            timings["role_stats_uncached"].append(_timed(uncached_role_stats, target))
+
+            internship_data.get_trending_skills(target, 25)
+            timings["trending_cached"].append(
+                _timed(internship_data.get_trending_skills, target, 25))
+
+    max_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if platform.system() == "Darwin":
+        max_rss_kb //= 1024
+
+    return {
+        "rows": len(dataset.df),
+        "csv_bytes": os.path.getsize(csv_path),
+        "streaming": dataset.streaming,
+        "distinct_skills": len(dataset.skill_index.vocab),
+        "distinct_roles": len(dataset.role_index.roles),
+        "load_csv_s": round(load_csv_s, 4),
+        "load_snapshot_s": round(load_snapshot_s, 4),
+        "peak_rss_mb": round(max_rss_kb / 1024, 1),
+        "latency": {name: _percentiles(samples) for name, samples in timings.items()},
+    }
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workdir", help="Keep generated CSVs here (default: temp dir)")
+    parser.add_argument("--output", default=os.path.join(BENCHMARKS_DIR, "internship_data_bench.json"))
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.queries, args.seed)))
+        return
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="internships-bench-")
+    os.makedirs(workdir, exist_ok=True)
+
+    results = []
+    for size in args.sizes:
+        csv_path = os.path.join(workdir, f"internships_{size}.csv")
+        if not os.path.exists(csv_path):
+            print(f"📦 Generating {size:,} rows -> {csv_path}")
+            generate_csv(csv_path, size, seed=args.seed)
+
+        print(f"⏱️  Benchmarking {size:,} rows...")
+        out = subprocess.check_output(
+            [sys.executable, os.path.abspath(__file__), "--worker", csv_path,
+             "--queries", str(args.queries), "--seed", str(args.seed)],
+            text=True,
+        )
+        record = json.loads(out.strip().splitlines()[-1])
+        record["size"] = size
+        results.append(record)
+        lat = record["latency"]["role_stats_uncached"]
+        print(f"   load {record['load_csv_s']}s (snapshot {record['load_snapshot_s']}s), "
+              f"peak RSS {record['peak_rss_mb']} MB, role stats p50 {lat['p50_ms']} ms "
+              f"/ p99 {lat['p99_ms']} ms")
+
+    report = {
+        "benchmark": "internship_data",
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "queries": args.queries,
+        "seed": args.seed,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"✅ Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
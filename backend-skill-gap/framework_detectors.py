@@ -0,0 +1,209 @@
+# framework_detectors.py
+"""
+Framework detection over repository files.
+
+A FrameworkDetector names a skill, the keywords its usage always mentions,
+and the regular expressions that reveal it in dependency manifests
+(package.json, requirements.txt, pom.xml, ...) and in source files with
+given extensions. The registry compiles the keywords of every detector
+into ONE literal alternation, so each file is read in a single pass
+however many frameworks are registered; a detector's own rules are only
+run on the lines where one of its keywords occurs (rules match within a
+line).
+
+Scanning a file's text gives its signals ("React:code", "Django:manifest",
+...), which only depend on the content and are cached per blob SHA.
+Whether a signal counts for a file depends on its path: manifest rules
+count in manifest files, code rules in files with the detector's
+extensions (see FrameworkRegistry.matches).
+
+To detect another framework, register a detector:
+
+    DETECTORS.register(FrameworkDetector(
+        "Svelte", manifest=[r'"svelte"\\s*:'], code=[r"<script[^>]*>"], extensions=[".svelte"],
+        keywords=["svelte", "<script"],
+    ))
+"""
+import os
+import re
+import threading
+
+# Dependency manifests scanned wherever they are in the repository
+MANIFEST_FILES = {
+    "package.json", "requirements.txt", "pyproject.toml", "Pipfile", "setup.py", "environment.yml",
+    "pom.xml", "build.gradle", "build.gradle.kts", "Gemfile", "composer.json", "pubspec.yaml",
+}
+
+# Characters around a keyword its detector's rules can see
+RULE_WINDOW = 200
+
+_PY = (".py", ".ipynb")
+_JS = (".js", ".jsx", ".ts", ".tsx", ".mjs")
+_JVM = (".java", ".kt")
+
+
+class FrameworkDetector:
+    """One framework: the canonical skill name and its manifest / code rules."""
+
+    def __init__(self, name, manifest=(), code=(), extensions=(), reason=None, keywords=None):
+        self.name = name
+        self.keywords = [k.lower() for k in (keywords or [name])]
+        self.manifest = list(manifest)
+        self.code = list(code)
+        self.extensions = tuple(extensions)
+        self.reason = reason or f"{name} usage detected in code"
+
+
+class FrameworkRegistry:
+    def __init__(self, detectors=()):
+        self._lock = threading.Lock()
+        self._detectors = {}
+        self._compiled = None
+        for detector in detectors:
+            self.register(detector)
+
+    def register(self, detector: FrameworkDetector) -> None:
+        """Add (or replace, by name) a detector; the combined pattern is rebuilt on next use."""
+        with self._lock:
+            self._detectors[detector.name] = detector
+            self._compiled = None
+
+    @property
+    def detectors(self) -> dict:
+        return dict(self._detectors)
+
+    def _compile(self):
+        with self._lock:
+            if self._compiled is None:
+                # keyword -> [(line pattern, signal of each group)] of the detectors using it
+                by_keyword = {}
+                for detector in self._detectors.values():
+                    rules = [(kind, pattern) for kind, patterns in (("manifest", detector.manifest),
+                                                                    ("code", detector.code))
+                             for pattern in patterns]
+                    if not rules:
+                        continue
+                    line_pattern = re.compile(
+                        "|".join(f"(?P<r{i}>{pattern})" for i, (_, pattern) in enumerate(rules)),
+                        re.IGNORECASE | re.MULTILINE,
+                    )
+                    signals = [f"{detector.name}:{kind}" for kind, _ in rules]
+                    for keyword in detector.keywords:
+                        by_keyword.setdefault(keyword, []).append((line_pattern, signals))
+                # Longest first, so a keyword is not shadowed by one of its prefixes
+                keywords = sorted(by_keyword, key=len, reverse=True)
+                pattern = re.compile("|".join(re.escape(k) for k in keywords) or "(?!)")
+                extensions = tuple({ext for d in self._detectors.values() for ext in d.extensions})
+                self._compiled = (pattern, by_keyword, extensions)
+            return self._compiled
+
+    @property
+    def code_extensions(self) -> tuple:
+        """Extensions of the source files any detector looks at."""
+        return self._compile()[2]
+
+    def scan(self, text: str) -> list:
+        """
+        Sorted signals found in `text`: one pass of the keyword alternation
+        over the lower-cased text, then each keyword's rules around it on
+        its line.
+        """
+        pattern, by_keyword, _ = self._compile()
+        lowered = text.lower()
+        found = set()
+        checked = set()
+        finished = set()    # keywords whose rules have all matched already
+        for match in pattern.finditer(lowered):
+            keyword = match.group()
+            if keyword in finished:
+                continue
+            # The keyword's line, at most RULE_WINDOW characters either side
+            # (minified bundles are one huge line)
+            start = max(lowered.rfind("\n", max(match.start() - RULE_WINDOW, 0), match.start()) + 1,
+                        match.start() - RULE_WINDOW)
+            if (start, keyword) in checked:
+                continue
+            checked.add((start, keyword))
+            end = lowered.find("\n", match.end(), match.end() + RULE_WINDOW)
+            if end < 0:
+                end = min(match.end() + RULE_WINDOW, len(lowered))
+            for line_pattern, signals in by_keyword[keyword]:
+                for hit in line_pattern.finditer(lowered, start, end):
+                    found.add(signals[int(hit.lastgroup[1:])])
+            if found.issuperset(signal for _, signals in by_keyword[keyword] for signal in signals):
+                finished.add(keyword)
+        return sorted(found)
+
+    def matches(self, path: str, signals) -> list:
+        """(detector, reason) for the signals that count in a file at `path`."""
+        name = path.rsplit("/", 1)[-1]
+        is_manifest = name in MANIFEST_FILES
+        ext = os.path.splitext(name)[1].lower()
+        found = []
+        for signal in signals:
+            detector_name, kind = signal.rsplit(":", 1)
+            detector = self._detectors.get(detector_name)
+            if detector is None:
+                continue
+            if kind == "manifest" and is_manifest:
+                found.append((detector, f"{detector.name} found in {name}"))
+            elif kind == "code" and ext in detector.extensions:
+                found.append((detector, detector.reason))
+        return found
+
+
+def _py_dependency(package):
+    # requirements.txt / Pipfile / pyproject.toml / setup.py / environment.yml entries
+    return rf"""^[\s\-"']*{package}\b"""
+
+
+def _js_dependency(package):
+    return rf'"{re.escape(package)}"\s*:'
+
+
+def _js_import(package):
+    return rf"""(?:from\s+|require\(\s*)['"]{re.escape(package)}(?:/[^'"]*)?['"]"""
+
+
+DETECTORS = FrameworkRegistry([
+    FrameworkDetector(
+        "React",
+        manifest=[_js_dependency("react")],
+        code=[_js_import("react"), r"\bimport\s+react\b", r"\buse(?:State|Effect)\b"],
+        extensions=(".js", ".jsx", ".tsx"),
+        reason="React components/hooks detected",
+        keywords=["react", "usestate", "useeffect"],
+    ),
+    FrameworkDetector("Next.js", manifest=[_js_dependency("next")], code=[_js_import("next")], extensions=_JS,
+                      keywords=["next"]),
+    FrameworkDetector("Vue", manifest=[_js_dependency("vue")], code=[_js_import("vue")], extensions=_JS + (".vue",)),
+    FrameworkDetector("Angular", manifest=[_js_dependency("@angular/core")], code=[_js_import("@angular/core")],
+                      extensions=(".ts",)),
+    FrameworkDetector("Express", manifest=[_js_dependency("express")], code=[_js_import("express")], extensions=_JS),
+    FrameworkDetector("NestJS", manifest=[_js_dependency("@nestjs/core")], code=[_js_import("@nestjs/common")],
+                      extensions=(".ts",)),
+    FrameworkDetector("Redux", manifest=[_js_dependency("redux"), _js_dependency("@reduxjs/toolkit")]),
+    FrameworkDetector("Tailwind CSS", manifest=[_js_dependency("tailwindcss")], keywords=["tailwindcss"]),
+    FrameworkDetector("Mongoose", manifest=[_js_dependency("mongoose")], code=[_js_import("mongoose")],
+                      extensions=_JS),
+    FrameworkDetector("Jest", manifest=[_js_dependency("jest")]),
+    FrameworkDetector("Django", manifest=[_py_dependency("django")], code=[r"\b(?:from|import)\s+django\b"],
+                      extensions=_PY),
+    FrameworkDetector("Flask", manifest=[_py_dependency("flask")], code=[r"\b(?:from|import)\s+flask\b"],
+                      extensions=_PY),
+    FrameworkDetector("FastAPI", manifest=[_py_dependency("fastapi")], code=[r"\b(?:from|import)\s+fastapi\b"],
+                      extensions=_PY),
+    FrameworkDetector("TensorFlow", manifest=[_py_dependency("tensorflow")],
+                      code=[r"\b(?:from|import)\s+tensorflow\b"], extensions=_PY),
+    FrameworkDetector("PyTorch", manifest=[_py_dependency("torch")], code=[r"\b(?:from|import)\s+torch\b"],
+                      extensions=_PY, keywords=["torch"]),
+    FrameworkDetector("Scikit-learn", manifest=[_py_dependency("scikit-learn")],
+                      code=[r"\b(?:from|import)\s+sklearn\b"], extensions=_PY,
+                      keywords=["scikit-learn", "sklearn"]),
+    FrameworkDetector("Pandas", manifest=[_py_dependency("pandas")], code=[r"\bimport\s+pandas\b"], extensions=_PY),
+    FrameworkDetector("Spring Boot", manifest=[r"spring-boot"], code=[r"\bimport\s+org\.springframework\."],
+                      extensions=_JVM, keywords=["spring"]),
+    FrameworkDetector("Flutter", manifest=[r"^\s*flutter\s*:"]),
+    FrameworkDetector("Laravel", manifest=[r'"laravel/framework"']),
+    FrameworkDetector("Ruby on Rails", manifest=[r"""^\s*gem\s+['"]rails['"]"""], keywords=["rails"]),
+])
@@ -0,0 +1,243 @@
+# github_cache.py
+"""
+Persistent cache for GitHub repository analysis.
+
+Repository evidence (language bytes, detected frameworks, project card,
+code samples) only depends on the commit it was collected from, so it is
+stored under `owner/repo@<head sha>` and reused until the repository moves.
+The head SHA of each repository is remembered with the ETag of the request
+that returned it, so checking for new commits is a conditional request
+that GitHub answers with 304 (and does not charge to the rate limit) while
+nothing changed.
+
+When the repository does move, the evidence of the last analyzed commit
+is the base for the new one: only the files in the compare diff are read
+again, and AI scores are reused unless the evidence changed materially.
+
+Entries are JSON files written atomically, so several workers can share
+one cache directory; the oldest files are pruned past GITHUB_CACHE_MAX_ENTRIES.
+
+Individual files are cached in memory by git blob SHA (BlobCache): the same
+blob (a starter template's package.json, a fork's components) has the same
+SHA in every repository, so once scanned it is never downloaded again.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+GITHUB_CACHE_DIR = os.getenv(
+    "GITHUB_CACHE_DIR",
+    os.path.join(os.path.dirname(__file__), ".github_cache"),
+)
+GITHUB_CACHE_MAX_ENTRIES = int(os.getenv("GITHUB_CACHE_MAX_ENTRIES", "2000"))
+GITHUB_BLOB_CACHE_BYTES = int(os.getenv("GITHUB_BLOB_CACHE_BYTES", str(32 * 1024 * 1024)))
+
+# Bump when the shape of cached evidence changes
+ANALYSIS_CACHE_VERSION = 4
+
+
+class AnalysisCache:
+    """
+    JSON stores under one directory:
+      refs/      owner/repo -> {"sha", "etag"} of the last head lookup
+      evidence/  owner/repo@sha -> collected repository evidence
+      latest/    owner/repo -> {"sha"} of the newest complete evidence, the
+                 base for analyzing the next commit from its diff
+      scores/    analysis target -> AI scores and the evidence they were
+                 computed from
+    """
+
+    def __init__(self, directory: str, max_entries: int):
+        self.directory = directory
+        self.max_entries = max_entries
+        self._writes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, kind: str, key: str) -> str:
+        digest = hashlib.sha256(key.lower().encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, kind, f"{digest}.json")
+
+    def _read(self, kind: str, key: str):
+        try:
+            with open(self._path(kind, key), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("version") != ANALYSIS_CACHE_VERSION or entry.get("key", "").lower() != key.lower():
+            return None
+        return entry["value"]
+
+    def _write(self, kind: str, key: str, value) -> None:
+        path = self._path(kind, key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": ANALYSIS_CACHE_VERSION, "key": key, "value": value}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ Could not write GitHub cache entry {key}: {e}")
+            return
+
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % 100 == 0
+        if prune:
+            self.prune(kind)
+
+    def get_ref(self, full_name: str) -> dict | None:
+        return self._read("refs", full_name)
+
+    def put_ref(self, full_name: str, sha: str, etag: str | None) -> None:
+        self._write("refs", full_name, {"sha": sha, "etag": etag})
+
+    def get_evidence(self, key: str) -> dict | None:
+        value = self._read("evidence", key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def put_evidence(self, key: str, evidence: dict) -> None:
+        self._write("evidence", key, evidence)
+
+    def get_latest(self, full_name: str) -> dict | None:
+        return self._read("latest", full_name)
+
+    def put_latest(self, full_name: str, sha: str) -> None:
+        self._write("latest", full_name, {"sha": sha})
+
+    def get_scores(self, target: str) -> dict | None:
+        return self._read("scores", target)
+
+    def put_scores(self, target: str, scores: dict) -> None:
+        self._write("scores", target, scores)
+
+    def prune(self, kind: str) -> None:
+        """Drop the least recently written files beyond max_entries."""
+        directory = os.path.join(self.directory, kind)
+        try:
+            paths = [os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(".json")]
+            if len(paths) <= self.max_entries:
+                return
+            paths.sort(key=lambda p: os.stat(p).st_mtime)
+            for path in paths[:len(paths) - self.max_entries]:
+                os.remove(path)
+        except OSError as e:
+            print(f"⚠️ Could not prune GitHub cache: {e}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "directory": self.directory}
+
+
+class BlobCache:
+    """
+    In-memory LRU of per-blob scan results keyed by git blob SHA, bounded by
+    the approximate size of the stored values (truncated samples and
+    detector signals, never whole files).
+    """
+
+    ENTRY_OVERHEAD = 200  # dict, key and flags per entry, roughly
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()
+        self._sizes: dict = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _size(value: dict) -> int:
+        size = BlobCache.ENTRY_OVERHEAD
+        for v in value.values():
+            if isinstance(v, str):
+                size += len(v)
+            elif isinstance(v, list):
+                size += sum(len(item) for item in v)
+        return size
+
+    def get_many(self, shas) -> dict:
+        """{sha: scan result} for the SHAs already cached."""
+        found = {}
+        with self._lock:
+            for sha in shas:
+                value = self._entries.get(sha)
+                if value is None:
+                    self.misses += 1
+                    continue
+                self._entries.move_to_end(sha)
+                self.hits += 1
+                found[sha] = value
+        return found
+
+    def put(self, sha: str, value: dict) -> None:
+        size = self._size(value)
+        with self._lock:
+            if sha in self._entries:
+                self._bytes -= self._sizes[sha]
+            self._entries[sha] = value
+            self._entries.move_to_end(sha)
+            self._sizes[sha] = size
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._entries:
+                old_sha, _ = self._entries.popitem(last=False)
+                self._bytes -= self._sizes.pop(old_sha)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key into one: the first caller
+    runs the function, everyone else arriving meanwhile waits for and shares
+    its result (or exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight: dict = {}
+
+    def do(self, key, fn):
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._inflight[key]
+        return future.result()
+
+
+ANALYSIS_CACHE = AnalysisCache(GITHUB_CACHE_DIR, GITHUB_CACHE_MAX_ENTRIES)
+BLOB_CACHE = BlobCache(GITHUB_BLOB_CACHE_BYTES)
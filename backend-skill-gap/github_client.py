@@ -0,0 +1,211 @@
+# github_client.py
+"""
+Shared GitHub access for the skill analysis.
+
+All GitHub API calls go through one GitHubScheduler (GITHUB_SCHEDULER.call),
+which
+  - paces requests with a token bucket (GITHUB_REQUESTS_PER_SECOND, bursts
+    of up to GITHUB_REQUEST_BURST),
+  - tracks the remaining quota and its reset time from the X-RateLimit-*
+    headers of every response,
+  - serves cheap metadata calls (repo, languages, tree, head commit) before
+    blob downloads, and stops downloading blobs altogether once fewer than
+    GITHUB_QUOTA_RESERVE requests remain, keeping the rest for metadata,
+  - raises GitHubRateLimited instead of issuing requests that would fail,
+and reports quota, queue depth and throttling through stats() (/health).
+"""
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+from github import Auth, Github, RateLimitExceededException
+from urllib3.util.retry import Retry
+
+GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+
+GITHUB_REQUESTS_PER_SECOND = float(os.getenv("GITHUB_REQUESTS_PER_SECOND", "10"))
+GITHUB_REQUEST_BURST = int(os.getenv("GITHUB_REQUEST_BURST", "20"))
+GITHUB_QUOTA_RESERVE = int(os.getenv("GITHUB_QUOTA_RESERVE", "100"))
+# Longest a call waits for its turn before giving up
+GITHUB_MAX_QUEUE_WAIT = float(os.getenv("GITHUB_MAX_QUEUE_WAIT_SECONDS", "15"))
+
+# Call priorities
+METADATA = "metadata"
+BLOB = "blob"
+
+
+class GitHubRateLimited(Exception):
+    """The GitHub quota (or the share left for this kind of call) is used up."""
+
+    def __init__(self, message: str, reset_at: float | None = None):
+        super().__init__(message)
+        self.reset_at = reset_at
+
+    @property
+    def reset_time(self) -> str | None:
+        if not self.reset_at:
+            return None
+        return datetime.fromtimestamp(self.reset_at, timezone.utc).isoformat()
+
+
+class GitHubScheduler:
+    def __init__(self, rate: float, burst: int, reserve: int, max_wait: float):
+        self.rate = rate
+        self.burst = burst
+        self.reserve = reserve
+        self.max_wait = max_wait
+        self.client: Github | None = None
+
+        self._cond = threading.Condition()
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+
+        self.remaining: int | None = None
+        self.limit: int | None = None
+        self.reset_at: float | None = None
+
+        self.waiting = {METADATA: 0, BLOB: 0}
+        self.calls = {METADATA: 0, BLOB: 0}
+        self.throttled = 0
+        self.shed = 0
+        self.rate_limited = 0
+
+    # ---- quota -------------------------------------------------------------
+
+    def _quota_check(self, priority: str) -> None:
+        """Raise if this call should not be sent with the quota we have left."""
+        if self.remaining is None:
+            return
+        if self.reset_at is not None and time.time() >= self.reset_at:
+            # The window rolled over; the next response will tell us the new numbers
+            self.remaining = None
+            return
+        if self.remaining <= 0:
+            self.rate_limited += 1
+            raise GitHubRateLimited("GitHub API rate limit exhausted", self.reset_at)
+        if priority == BLOB and self.remaining <= self.reserve:
+            self.shed += 1
+            raise GitHubRateLimited(
+                f"GitHub quota low ({self.remaining} left), file downloads paused", self.reset_at
+            )
+
+    def observe_headers(self, headers) -> None:
+        """Update the quota from a response's X-RateLimit-* headers."""
+        remaining = headers.get("X-RateLimit-Remaining") or headers.get("x-ratelimit-remaining")
+        if remaining is None:
+            return
+        with self._cond:
+            self.remaining = int(remaining)
+            limit = headers.get("X-RateLimit-Limit") or headers.get("x-ratelimit-limit")
+            reset = headers.get("X-RateLimit-Reset") or headers.get("x-ratelimit-reset")
+            if limit is not None:
+                self.limit = int(limit)
+            if reset is not None:
+                self.reset_at = float(reset)
+
+    def _observe_client(self) -> None:
+        # PyGithub keeps the X-RateLimit-* headers of its last response
+        remaining, limit = self.client.rate_limiting
+        with self._cond:
+            self.remaining, self.limit = remaining, limit
+            self.reset_at = float(self.client.rate_limiting_resettime)
+
+    # ---- pacing ------------------------------------------------------------
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+    def acquire(self, priority: str) -> None:
+        """
+        Wait for a token. Blob downloads yield to queued metadata calls.
+        Raises GitHubRateLimited if the quota does not allow the call.
+        """
+        give_up = time.monotonic() + self.max_wait
+        with self._cond:
+            self.waiting[priority] += 1
+            waited = False
+            try:
+                while True:
+                    self._quota_check(priority)
+                    self._refill()
+                    if self._tokens >= 1 and (priority == METADATA or not self.waiting[METADATA]):
+                        self._tokens -= 1
+                        break
+                    waited = True
+                    timeout = max((1 - self._tokens) / self.rate, 0.01)
+                    if time.monotonic() + timeout > give_up:
+                        self.shed += 1
+                        raise GitHubRateLimited("Timed out waiting for a GitHub request slot", self.reset_at)
+                    self._cond.wait(timeout)
+                self.calls[priority] += 1
+                if waited:
+                    self.throttled += 1
+            finally:
+                self.waiting[priority] -= 1
+                self._cond.notify_all()
+
+    def call(self, priority: str, fn, *args, **kwargs):
+        """Run one GitHub API call (PyGithub method) under the scheduler."""
+        self.acquire(priority)
+        try:
+            return fn(*args, **kwargs)
+        except RateLimitExceededException as e:
+            self.observe_headers(e.headers or {})
+            with self._cond:
+                self.remaining = 0
+                self.rate_limited += 1
+            raise GitHubRateLimited("GitHub API rate limit exceeded", self.reset_at) from e
+        finally:
+            if self.client is not None:
+                try:
+                    self._observe_client()
+                except Exception:
+                    pass
+
+    def stats(self) -> dict:
+        with self._cond:
+            reset = datetime.fromtimestamp(self.reset_at, timezone.utc).isoformat() if self.reset_at else None
+            return {
+                "remaining": self.remaining,
+                "limit": self.limit,
+                "reset_at": reset,
+                "queue_depth": dict(self.waiting),
+                "calls": dict(self.calls),
+                "throttled": self.throttled,
+                "shed": self.shed,
+                "rate_limited": self.rate_limited,
+            }
+
+
+GITHUB_SCHEDULER = GitHubScheduler(
+    GITHUB_REQUESTS_PER_SECOND, GITHUB_REQUEST_BURST, GITHUB_QUOTA_RESERVE, GITHUB_MAX_QUEUE_WAIT
+)
+
+_client_lock = threading.Lock()
+
+
+def build_github_client(token: str | None = GITHUB_TOKEN, **kwargs) -> Github:
+    """
+    A PyGithub client whose only throttle is GITHUB_SCHEDULER. PyGithub's
+    own pacing (seconds_between_requests) is off, and its default retry
+    policy is replaced: GithubRetry sleeps until X-RateLimit-Reset (up to an
+    hour) on a rate-limited 403, where the scheduler needs the
+    RateLimitExceededException right away. Only server errors are retried.
+    """
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504), raise_on_status=False)
+    auth = Auth.Token(token) if token else None
+    return Github(auth=auth, retry=retry, seconds_between_requests=None, seconds_between_writes=None, **kwargs)
+
+
+def get_github_client() -> Github:
+    """
+    The process-wide PyGithub client. Sharing it lets the scheduler read
+    the quota headers of every response from one place.
+    """
+    with _client_lock:
+        if GITHUB_SCHEDULER.client is None:
+            GITHUB_SCHEDULER.client = build_github_client()
+        return GITHUB_SCHEDULER.client
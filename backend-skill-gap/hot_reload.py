@@ -0,0 +1,91 @@
+# hot_reload.py
+"""
+Values built from a data file and rebuilt when the file changes, without
+restarting the worker (the internships dataset, the skill taxonomy).
+
+A HotReloader holds the current value and the fingerprint (mtime, size) of
+the file it was built from. get() builds it on first use; after that the
+file is checked at most every `check_seconds` and, if it changed, rebuilt
+either in the request (cheap builds) or in a background thread while
+requests keep the current value. A rebuilt value is swapped in with a
+single assignment, so readers always see a complete version; a build that
+raises leaves the current value in place.
+"""
+import os
+import threading
+import time
+
+
+def file_fingerprint(path: str) -> dict:
+    stat = os.stat(path)
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+class HotReloader:
+    """
+    `build(current, fingerprint, force)` makes the new value from the file
+    at `path()` and returns (value, result); `current` is None on first
+    load. It runs under the reloader's lock, one build at a time.
+    """
+
+    def __init__(self, name, path, build, check_seconds, background=False):
+        self.name = name
+        self.path = path
+        self.build = build
+        self.check_seconds = check_seconds
+        self.background = background
+        self.value = None
+        self.fingerprint = None
+        self._lock = threading.Lock()
+        self._last_check = 0.0
+
+    def reload(self, force=False):
+        """
+        Rebuild if the file changed since the current value was built (or
+        `force`). Returns the build's result, or None if nothing changed.
+        """
+        with self._lock:
+            return self._reload(force)
+
+    def _reload(self, force):
+        fingerprint = file_fingerprint(self.path())
+        if self.value is not None and not force and fingerprint == self.fingerprint:
+            return None
+        value, result = self.build(self.value, fingerprint, force)
+        self.value, self.fingerprint = value, fingerprint
+        return result
+
+    def _reload_quietly(self):
+        try:
+            self.reload()
+        except Exception as e:
+            print(f"⚠️ {self.name} reload failed, keeping the current version: {e}")
+
+    def get(self):
+        """The current value, checking the file for changes at most every check_seconds."""
+        value = self.value
+        if value is None:
+            with self._lock:
+                if self.value is None:
+                    self._reload(False)
+                return self.value
+
+        now = time.monotonic()
+        if 0 <= self.check_seconds <= now - self._last_check:
+            self._last_check = now
+            try:
+                changed = file_fingerprint(self.path()) != self.fingerprint
+            except OSError:
+                changed = False
+            if changed and not self._lock.locked():
+                if self.background:
+                    threading.Thread(target=self._reload_quietly, daemon=True).start()
+                else:
+                    self._reload_quietly()
+                    return self.value
+        return value
+
+    def clear(self):
+        """Forget the current value; the next get() builds it again."""
+        with self._lock:
+            self.value = self.fingerprint = None
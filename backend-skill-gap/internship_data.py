@@ -2,14 +2,47 @@
 import os
 import re
 import ast
+import pickle
+import hashlib
+import tempfile
+import threading
+import time
+from collections import OrderedDict
 from functools import lru_cache
-from typing import List, Dict
+from itertools import chain
+from typing import Callable, List, Dict
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
+
+from hot_reload import HotReloader, file_fingerprint
+from skill_taxonomy import SkillResolver, SkillTaxonomy, load_taxonomy
 
 # Path to your CSV (relative to this file)
 CSV_PATH = os.path.join(os.path.dirname(__file__), "internships.csv")
 
+# Preprocessed copy of the CSV so new workers skip parsing on their first request.
+# Bump SNAPSHOT_VERSION whenever the preprocessing below changes.
+SNAPSHOT_PATH = os.getenv(
+    "INTERNSHIPS_SNAPSHOT_PATH",
+    os.path.join(os.path.dirname(__file__), "internships.snapshot.pkl"),
+)
+SNAPSHOT_VERSION = 5
+
+# CSVs at least this big are ingested in chunks, keeping only the columns the
+# analytics use (see _stream_internships_csv). Set INTERNSHIPS_STREAMING=1
+# to force streaming for any size.
+STREAMING_MIN_BYTES = int(os.getenv("INTERNSHIPS_STREAMING_MIN_BYTES", str(64 * 1024 * 1024)))
+STREAMING_CHUNK_ROWS = int(os.getenv("INTERNSHIPS_CHUNK_ROWS", "100000"))
+
+# How often (seconds) load_dataset() checks the CSV for changes; -1 disables
+RELOAD_CHECK_SECONDS = float(os.getenv("INTERNSHIPS_RELOAD_CHECK_SECONDS", "30"))
+
+# Per-role statistics cache (see QueryCache / get_role_stats)
+QUERY_CACHE_SIZE = int(os.getenv("INTERNSHIPS_QUERY_CACHE_SIZE", "256"))
+QUERY_CACHE_TTL = float(os.getenv("INTERNSHIPS_QUERY_CACHE_TTL", "3600"))
+
 
 def _parse_skills_cell(cell: str) -> List[str]:
     """
@@ -57,62 +90,962 @@ def _parse_stipend(cell: str) -> float:
         return 0.0
 
 
-@lru_cache(maxsize=1)
-def load_internships_df() -> pd.DataFrame:
+# A plain list literal of simply-quoted strings: ['A', "B's"] (no escapes,
+# no line breaks or NUL inside an item, only spaces / tabs between items).
+# Cells in this shape are tokenized in bulk; anything else goes through
+# _parse_skills_cell so results stay identical.
+_QUOTED_ITEM = r"'[^'\\\n\r\0]*'" + r'|"[^"\\\n\r\0]*"'
+_SIMPLE_LIST_RE = (
+    rf"\s*\[[ \t]*(?:(?:{_QUOTED_ITEM})[ \t]*(?:,[ \t]*(?:{_QUOTED_ITEM})[ \t]*)*,?[ \t]*)?\]\s*"
+)
+_ITEM_RE = r"'([^'\\\n\r\0]*)'" + r'|"([^"\\\n\r\0]*)"'
+
+
+def _parse_skills_column(cells: pd.Series) -> pd.Series:
+    """
+    Column-wide version of _parse_skills_cell.
+    """
+    result = pd.Series([[] for _ in range(len(cells))], index=cells.index, dtype=object)
+
+    present = cells.notna()
+    text = cells[present].astype(str)
+    simple = text.str.fullmatch(_SIMPLE_LIST_RE)
+
+    tokens = text[simple].str.lower().str.findall(_ITEM_RE)
+    result[tokens.index] = pd.Series(
+        [[s for s in (a.strip() or b.strip() for a, b in items) if s] for items in tokens],
+        index=tokens.index,
+        dtype=object,
+    )
+
+    rest = text[~simple]
+    if len(rest):
+        result[rest.index] = rest.map(_parse_skills_cell)
+    return result
+
+
+def _parse_stipend_column(cells: pd.Series) -> pd.Series:
     """
-    Load and preprocess the internships CSV once.
+    Column-wide version of _parse_stipend.
+    """
+    first = cells[cells.notna()].astype(str).str.extract(r"(\d[\d,]*)", expand=False)
+    values = first.str.replace(",", "", regex=False).astype(float)
+    return values.reindex(cells.index).fillna(0.0)
+
+
+# Columns the analytics need from the CSV
+REQUIRED_COLUMNS = ["role", "skills", "stipend"]
+
+
+def _normalize_column(name: str) -> str:
+    """Normalize column names -> lower_case_with_underscores"""
+    return name.strip().lower().replace(" ", "_")
+
+
+def _check_columns(columns) -> None:
+    """Ensure important columns exist"""
+    for col in REQUIRED_COLUMNS:
+        if col not in columns:
+            raise ValueError(f"CSV must have a '{col}' column. Found: {columns}")
+
+
+def _read_internships_csv() -> pd.DataFrame:
+    """
+    Parse and preprocess the internships CSV.
     Column names in your screenshot:
     Internship Id | Role | Company Name | Location | Duration | Stipend | Intern Type | Skills | ...
     """
-    if not os.path.exists(CSV_PATH):
-        raise FileNotFoundError(f"CSV file not found at {CSV_PATH}")
-
     # Encoding 'utf-8' usually works; if you see errors, use errors="ignore"
     df = pd.read_csv(CSV_PATH, encoding="utf-8")
 
-    # Normalize column names -> lower_case_with_underscores
-    df.columns = [c.strip().lower().replace(" ", "_") for c in df.columns]
+    df.columns = [_normalize_column(c) for c in df.columns]
+    _check_columns(df.columns)
+    return _prepare_frame(df)
 
-    # Ensure important columns exist
-    required = ["role", "skills", "stipend"]
-    for col in required:
-        if col not in df.columns:
-            raise ValueError(f"CSV must have a '{col}' column. Found: {df.columns}")
 
+def _prepare_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add the parsed columns the analytics use to a raw (column-normalized) frame.
+    """
     # Parse skills column into lists
-    df["skill_list"] = df["skills"].apply(_parse_skills_cell)
+    df["skill_list"] = _parse_skills_column(df["skills"])
 
     # Parse stipend into numeric
-    df["stipend_value"] = df["stipend"].apply(_parse_stipend)
+    df["stipend_value"] = _parse_stipend_column(df["stipend"])
 
     # Normalized role field for searching
     df["role_norm"] = df["role"].fillna("").str.lower()
 
+    # Row ids double as positions into the skill index
+    return df.reset_index(drop=True)
+
+
+class SkillIndex:
+    """
+    Integer-coded view of the `skill_list` column.
+
+    Every distinct skill gets an id (in order of first appearance) and the
+    per-row lists are flattened into one CSR-style array:
+        entry_codes[row_offsets[r]:row_offsets[r + 1]] -> skill ids of row r
+    so counting skills over any subset of rows is a gather plus a bincount.
+
+    The canonical display name and canonical id of every vocab entry
+    (canonical_table().names / .ids) are computed once per vocabulary
+    and taxonomy version and stored in the snapshot, so trends read them from
+    a table and user / GitHub skills join against the vocabulary by id.
+    """
+
+    def __init__(
+        self,
+        vocab: np.ndarray,
+        entry_codes: np.ndarray,
+        row_offsets: np.ndarray,
+        canonical: "CanonicalTable | None" = None,
+    ):
+        self.vocab = vocab
+        self.entry_codes = entry_codes
+        self.row_offsets = row_offsets
+        self.skill_codes = {s: i for i, s in enumerate(vocab)}
+        self._canonical = canonical
+
+    def canonical_table(self, taxonomy: SkillTaxonomy | None = None) -> "CanonicalTable":
+        """
+        Canonical names / ids of the vocabulary under the current taxonomy,
+        recomputed (vocab only, not rows) after a taxonomy reload.
+        """
+        taxonomy = taxonomy or load_taxonomy()
+        table = self._canonical
+        if table is None or table.version != taxonomy.version:
+            table = CanonicalTable.for_vocab(self.vocab, taxonomy)
+            self._canonical = table
+        return table
+
+    @classmethod
+    def from_skill_lists(cls, skill_lists: pd.Series) -> "SkillIndex":
+        lengths = skill_lists.map(len).to_numpy(dtype=np.int64)
+        flat = list(chain.from_iterable(skill_lists))
+        codes, uniques = pd.factorize(pd.Series(flat, dtype=object), sort=False)
+
+        row_offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=row_offsets[1:])
+        return cls(np.asarray(uniques, dtype=object), codes.astype(np.int32), row_offsets)
+
+    @property
+    def num_rows(self) -> int:
+        return len(self.row_offsets) - 1
+
+    def skill_lists(self) -> List[List[str]]:
+        """Rebuild the per-row skill lists from the codes."""
+        values = self.vocab[self.entry_codes]
+        return [chunk.tolist() for chunk in np.split(values, self.row_offsets[1:-1])]
+
+    def display_name(self, skill: str) -> str:
+        """Canonical display name of a vocab skill ('ms-excel' -> 'Ms-Excel')."""
+        taxonomy = load_taxonomy()
+        s = self.skill_codes.get(skill)
+        return taxonomy.canonicalize(skill) if s is None else self.canonical_table(taxonomy).names[s]
+
+    def codes_for(self, skills) -> np.ndarray:
+        """
+        Vocab ids of every dataset skill sharing a canonical id with one of
+        `skills` (user / GitHub names in any casing or alias).
+        """
+        taxonomy = load_taxonomy()
+        codes_by_id = self.canonical_table(taxonomy).codes_by_id
+        codes = [c for skill in skills for c in codes_by_id.get(taxonomy.skill_id(skill), ())]
+        return np.unique(np.array(codes, dtype=np.int64))
+
+    def ranked_counts(self, rows: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Skill ids and counts over `rows` (all rows if None), most frequent first.
+        Ties keep the order in which skills first appear within those rows,
+        matching the old dict-based counter.
+        """
+        if rows is None:
+            codes = self.entry_codes
+        else:
+            # Gather only the selected rows' entries (in row order), O(len(rows) + their entries)
+            rows = np.unique(rows)
+            starts = self.row_offsets[rows]
+            lengths = self.row_offsets[rows + 1] - starts
+            shift = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+            codes = self.entry_codes[np.arange(int(lengths.sum()), dtype=np.int64) + shift]
+
+        if not len(codes):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        counts = np.bincount(codes, minlength=len(self.vocab))
+        present, first_seen = np.unique(codes, return_index=True)
+        order = np.lexsort((first_seen, -counts[present]))
+        return present[order], counts[present[order]]
+
+
+class CanonicalTable:
+    """
+    Canonical display names and ids for each vocab entry (in vocab order)
+    under one taxonomy version, plus canonical id -> vocab ids.
+    """
+
+    def __init__(self, version: str, names: np.ndarray, ids: np.ndarray):
+        self.version = version
+        self.names = names
+        self.ids = ids
+        self.codes_by_id: Dict[str, List[int]] = {}
+        for i, skill_id in enumerate(ids):
+            self.codes_by_id.setdefault(skill_id, []).append(i)
+
+    @staticmethod
+    def canonicalize(vocab, taxonomy: SkillTaxonomy) -> tuple[np.ndarray, np.ndarray]:
+        names = np.empty(len(vocab), dtype=object)
+        ids = np.empty(len(vocab), dtype=object)
+        names[:] = [taxonomy.canonicalize(s) for s in vocab]
+        ids[:] = [taxonomy.skill_id(s) for s in vocab]
+        return names, ids
+
+    @classmethod
+    def for_vocab(cls, vocab, taxonomy: SkillTaxonomy) -> "CanonicalTable":
+        return cls(taxonomy.version, *cls.canonicalize(vocab, taxonomy))
+
+    def extended(self, new_vocab, taxonomy: SkillTaxonomy) -> "CanonicalTable":
+        """This table plus entries for skills appended to the vocabulary."""
+        names, ids = self.canonicalize(new_vocab, taxonomy)
+        return CanonicalTable(
+            self.version, np.concatenate([self.names, names]), np.concatenate([self.ids, ids])
+        )
+
+
+class SkillIndexBuilder:
+    """
+    Builds a SkillIndex chunk by chunk. Each chunk is factorized on its own
+    and only its distinct skills are mapped into the global vocabulary, so
+    ids still follow first appearance across the whole file.
+    """
+
+    def __init__(self):
+        self.vocab: Dict[str, int] = {}
+        self.code_chunks: List[np.ndarray] = []
+        self.length_chunks: List[np.ndarray] = []
+        self.base: SkillIndex | None = None
+
+    @classmethod
+    def from_index(cls, index: SkillIndex) -> "SkillIndexBuilder":
+        """Start from an existing index so new rows can be appended to it."""
+        builder = cls()
+        builder.vocab = {s: i for i, s in enumerate(index.vocab)}
+        builder.code_chunks.append(index.entry_codes)
+        builder.length_chunks.append(np.diff(index.row_offsets))
+        builder.base = index
+        return builder
+
+    def add(self, skill_lists: pd.Series) -> None:
+        self.length_chunks.append(skill_lists.map(len).to_numpy(dtype=np.int64))
+        flat = list(chain.from_iterable(skill_lists))
+        codes, uniques = pd.factorize(pd.Series(flat, dtype=object), sort=False)
+        remap = np.array(
+            [self.vocab.setdefault(s, len(self.vocab)) for s in uniques], dtype=np.int32
+        )
+        self.code_chunks.append(remap[codes] if len(codes) else codes.astype(np.int32))
+
+    def build(self) -> SkillIndex:
+        lengths = np.concatenate(self.length_chunks) if self.length_chunks else np.empty(0, np.int64)
+        row_offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=row_offsets[1:])
+        codes = np.concatenate(self.code_chunks) if self.code_chunks else np.empty(0, np.int32)
+        vocab = np.empty(len(self.vocab), dtype=object)
+        vocab[:] = list(self.vocab)
+
+        # Only skills new since the base index need canonicalizing
+        canonical = None
+        if self.base is not None:
+            taxonomy = load_taxonomy()
+            canonical = self.base.canonical_table(taxonomy).extended(vocab[len(self.base.vocab):], taxonomy)
+        return SkillIndex(vocab, codes.astype(np.int32), row_offsets, canonical)
+
+
+class _CategoryCodes:
+    """Interns repeated strings (roles) as integer codes across chunks."""
+
+    def __init__(self):
+        self.categories: Dict[str, int] = {}
+        self.code_chunks: List[np.ndarray] = []
+
+    def add(self, values: pd.Series) -> None:
+        codes, uniques = pd.factorize(values, sort=False)
+        remap = np.array(
+            [self.categories.setdefault(v, len(self.categories)) for v in uniques], dtype=np.int32
+        )
+        self.code_chunks.append(remap[codes] if len(codes) else codes.astype(np.int32))
+
+    def build(self) -> pd.Categorical:
+        codes = np.concatenate(self.code_chunks) if self.code_chunks else np.empty(0, np.int32)
+        return pd.Categorical.from_codes(codes, categories=list(self.categories))
+
+
+def _use_streaming() -> bool:
+    if os.getenv("INTERNSHIPS_STREAMING", "").lower() in ("1", "true", "yes"):
+        return True
+    return os.path.getsize(CSV_PATH) >= STREAMING_MIN_BYTES
+
+
+def _stream_internships_csv() -> tuple[pd.DataFrame, SkillIndex]:
+    """
+    Chunked ingest for very large CSVs. Only role/skills/stipend are read,
+    each chunk is parsed and folded into the skill index and role codes, and
+    the raw text is dropped before the next chunk is read, so peak memory is
+    one chunk plus the compact result.
+
+    The returned frame has `role`, `role_norm` (categoricals) and
+    `stipend_value`; per-row skill lists live only in the skill index.
+    """
+    role, stipends, skills = _stream_csv_columns()
+    return _compact_frame(role, stipends), skills.build()
+
+
+def _stream_csv_columns(
+    offset: int = 0, skills: SkillIndexBuilder | None = None
+) -> tuple[pd.Categorical, np.ndarray, SkillIndexBuilder]:
+    """
+    The streaming pass of _stream_internships_csv over the rows starting at
+    byte `offset` (0: the whole file after the header; otherwise the start
+    of a line), folding skills into `skills` (a new builder if None).
+    Returns the rows' roles, stipends and the builder.
+    """
+    header = pd.read_csv(CSV_PATH, encoding="utf-8", nrows=0)
+    columns = {_normalize_column(c): c for c in header.columns}
+    _check_columns(list(columns))
+
+    skills = skills or SkillIndexBuilder()
+    roles = _CategoryCodes()
+    stipend_chunks: List[np.ndarray] = []
+
+    with open(CSV_PATH, "rb") as f:
+        if offset:
+            f.seek(offset)
+        chunks = pd.read_csv(
+            f,
+            encoding="utf-8",
+            header=None if offset else "infer",
+            names=list(header.columns) if offset else None,
+            usecols=[columns[c] for c in REQUIRED_COLUMNS],
+            dtype=str,
+            chunksize=STREAMING_CHUNK_ROWS,
+        )
+        for chunk in chunks:
+            chunk.columns = [_normalize_column(c) for c in chunk.columns]
+            skills.add(_parse_skills_column(chunk["skills"]))
+            stipend_chunks.append(_parse_stipend_column(chunk["stipend"]).to_numpy(dtype=np.float64))
+            roles.add(chunk["role"].fillna(""))
+
+    stipends = np.concatenate(stipend_chunks) if stipend_chunks else np.empty(0, np.float64)
+    return roles.build(), stipends, skills
+
+
+def _compact_frame(role: pd.Categorical, stipends: np.ndarray) -> pd.DataFrame:
+    df = pd.DataFrame({"role": role, "stipend_value": stipends})
+    # Lower-case the distinct roles once and map every row through its code
+    norm_codes, norm_roles = pd.factorize(role.categories.str.lower())
+    df["role_norm"] = pd.Categorical.from_codes(norm_codes[role.codes], categories=norm_roles)
     return df
 
 
-def _skill_frequency(df: pd.DataFrame) -> Dict[str, int]:
+def _csv_fingerprint() -> dict:
+    return file_fingerprint(CSV_PATH)
+
+
+def _csv_sha256(prefix_bytes: int | None = None) -> str | tuple[str, str]:
     """
-    Count how many internships mention each skill.
+    SHA-256 of the CSV. With `prefix_bytes`, also return the hash of just
+    the first `prefix_bytes` bytes (computed in the same pass) as
+    (prefix_hash, full_hash), which is how appends are recognized.
     """
-    counts: Dict[str, int] = {}
-    for skills in df["skill_list"]:
-        for s in skills:
-            counts[s] = counts.get(s, 0) + 1
-    return counts
+    digest = hashlib.sha256()
+    prefix_hash = None
+    remaining = prefix_bytes
+    with open(CSV_PATH, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            if remaining is not None and remaining <= len(block):
+                digest.update(block[:remaining])
+                prefix_hash = digest.hexdigest()
+                digest.update(block[remaining:])
+                remaining = None
+                continue
+            digest.update(block)
+            if remaining is not None:
+                remaining -= len(block)
+    if prefix_bytes is None:
+        return digest.hexdigest()
+    return prefix_hash, digest.hexdigest()
 
 
-def _filter_by_role(df: pd.DataFrame, target_role: str | None) -> pd.DataFrame:
+def _read_snapshot(fingerprint: dict) -> dict | None:
     """
-    Filter internships by role keyword if provided.
-    If no rows match, return the full dataframe so we still use the dataset.
+    Return the stored snapshot if it was built from the current CSV.
+    A matching mtime/size is trusted as-is; otherwise the content hash decides
+    (so a `touch` or fresh checkout does not force a rebuild).
+    """
+    try:
+        with open(SNAPSHOT_PATH, "rb") as f:
+            snapshot = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"⚠️ Ignoring unreadable internships snapshot: {e}")
+        return None
+
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+    if snapshot.get("fingerprint") == fingerprint:
+        return snapshot
+    if snapshot.get("sha256") == _csv_sha256():
+        # Same content, new mtime: refresh the cheap key for next time
+        snapshot["fingerprint"] = fingerprint
+        _write_snapshot(snapshot)
+        return snapshot
+    return None
+
+
+def _write_snapshot(snapshot: dict) -> None:
+    """
+    Write atomically so concurrently starting workers never see a partial file.
+    """
+    directory = os.path.dirname(os.path.abspath(SNAPSHOT_PATH))
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, SNAPSHOT_PATH)
+    except OSError as e:
+        print(f"⚠️ Could not write internships snapshot: {e}")
+
+
+class RoleIndex:
+    """
+    Literal substring lookup over the distinct `role_norm` values.
+
+    There are far fewer distinct roles than rows, so each distinct role gets
+    an id with its rows stored as a posting list, and a trigram index over
+    the role strings narrows a query down to a few candidate roles before the
+    final `in` check. Within each posting list rows are kept sorted by
+    stipend, so a role's stipend distribution is available without sorting
+    per request. Only the role ids a query resolves to are memoized (a small
+    tuple per key); its rows and stipends are gathered from the posting lists
+    on each call, so the memo stays small however many rows a role has.
+    """
+
+    NGRAM = 3
+
+    def __init__(self, role_norm: pd.Series, stipend_value: pd.Series):
+        codes, roles = pd.factorize(role_norm, sort=False)
+        self.roles = list(roles)
+
+        stipends = stipend_value.to_numpy(dtype=np.float64)
+        order = np.lexsort((stipends, codes))
+        self.posting_rows = order.astype(np.int32)
+        self.posting_stipends = stipends[order]
+        self.role_offsets = np.zeros(len(self.roles) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(codes, minlength=len(self.roles)), out=self.role_offsets[1:])
+
+        self.grams: Dict[str, set] = {}
+        for role_id, role in enumerate(self.roles):
+            for i in range(len(role) - self.NGRAM + 1):
+                self.grams.setdefault(role[i:i + self.NGRAM], set()).add(role_id)
+
+        self.matched_roles = lru_cache(maxsize=2048)(self._matched_roles)
+
+    def _candidate_roles(self, key: str):
+        if len(key) < self.NGRAM:
+            return range(len(self.roles))
+        candidates = None
+        for i in range(len(key) - self.NGRAM + 1):
+            ids = self.grams.get(key[i:i + self.NGRAM])
+            if not ids:
+                return ()
+            candidates = set(ids) if candidates is None else candidates & ids
+            if not candidates:
+                return ()
+        return candidates
+
+    def _matched_roles(self, key: str) -> tuple:
+        """Ids of the distinct roles containing `key` (already normalized), ascending."""
+        return tuple(sorted(r for r in self._candidate_roles(key) if key in self.roles[r]))
+
+    def count_matching(self, key: str) -> int:
+        """Number of rows whose role contains `key`."""
+        return int(sum(self.role_offsets[r + 1] - self.role_offsets[r] for r in self.matched_roles(key)))
+
+    def _segments(self, key: str) -> tuple[np.ndarray, np.ndarray]:
+        matched = self.matched_roles(key)
+        if not matched:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float64)
+        spans = [slice(self.role_offsets[r], self.role_offsets[r + 1]) for r in matched]
+        if len(spans) == 1:
+            return self.posting_rows[spans[0]], self.posting_stipends[spans[0]]
+        return (
+            np.concatenate([self.posting_rows[s] for s in spans]),
+            np.concatenate([self.posting_stipends[s] for s in spans]),
+        )
+
+    def rows_matching(self, key: str) -> np.ndarray:
+        """Sorted row ids whose role contains `key` (already normalized)."""
+        rows, _ = self._segments(key)
+        return np.sort(rows)
+
+    def stipends_matching(self, key: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        (stipends ascending, row ids in the same order) for the rows whose
+        role contains `key`. Merging the per-role runs is a stable sort over
+        already-sorted segments.
+        """
+        rows, stipends = self._segments(key)
+        order = np.argsort(stipends, kind="stable")
+        return stipends[order], rows[order]
+
+
+def _quantile_sorted(values: np.ndarray, percentile: float) -> float:
+    """
+    Linear-interpolated quantile of an ascending array in O(1), giving the
+    same result as Series.quantile (numpy's 'linear' method), including
+    its ValueError for percentiles outside [0, 1].
+    """
+    if not 0 <= percentile <= 1:
+        raise ValueError("percentiles should all be in the interval [0, 1]")
+    position = (len(values) - 1) * percentile
+    lo = int(np.floor(position))
+    hi = min(lo + 1, len(values) - 1)
+    gamma = position - lo
+    a, b = float(values[lo]), float(values[hi])
+    diff = b - a
+    return b - diff * (1 - gamma) if gamma >= 0.5 else a + diff * gamma
+
+
+class InternshipDataset:
+    """
+    The preprocessed dataframe, its skill and role indexes and a version
+    string (the CSV's SHA-256) that changes whenever the underlying data does.
+
+    A dataset is never modified after construction: reloads build a new one
+    and swap it in, so a request that grabbed one keeps a consistent view.
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        skill_index: SkillIndex,
+        version: str,
+        fingerprint: dict,
+        streaming: bool,
+    ):
+        self.df = df
+        self.skill_index = skill_index
+        self.role_index = RoleIndex(df["role_norm"], df["stipend_value"])
+        self.version = version
+        self.fingerprint = fingerprint
+        self.streaming = streaming
+        self._skill_resolver: SkillResolver | None = None
+
+    @property
+    def skill_resolver(self) -> SkillResolver:
+        """
+        Fuzzy resolver over the taxonomy plus this dataset's skills, built on
+        first use and rebuilt when the taxonomy version changes.
+        """
+        taxonomy = load_taxonomy()
+        resolver = self._skill_resolver
+        if resolver is None or resolver.taxonomy_version != taxonomy.version:
+            names = self.skill_index.canonical_table(taxonomy).names
+            resolver = SkillResolver(zip(self.skill_index.vocab, names), taxonomy=taxonomy)
+            self._skill_resolver = resolver
+        return resolver
+
+    def summary(self) -> dict:
+        return {
+            "rows": len(self.df),
+            "distinct_skills": len(self.skill_index.vocab),
+            "distinct_roles": len(self.role_index.roles),
+            "version": self.version,
+            "streaming": self.streaming,
+        }
+
+
+def _save_snapshot(dataset: InternshipDataset) -> None:
+    _write_snapshot({
+        "version": SNAPSHOT_VERSION,
+        "fingerprint": dataset.fingerprint,
+        "sha256": dataset.version,
+        "streaming": dataset.streaming,
+        "frame": dataset.df.drop(columns=["skill_list"], errors="ignore"),
+        "vocab": dataset.skill_index.vocab,
+        "entry_codes": dataset.skill_index.entry_codes,
+        "row_offsets": dataset.skill_index.row_offsets,
+        "canonical": dataset.skill_index.canonical_table(),
+    })
+
+
+def _build_dataset(use_snapshot: bool = True) -> InternshipDataset:
+    """
+    Build the dataset from the on-disk snapshot when it is still valid,
+    else from the CSV (refreshing the snapshot).
+    """
+    if not os.path.exists(CSV_PATH):
+        raise FileNotFoundError(f"CSV file not found at {CSV_PATH}")
+
+    fingerprint = _csv_fingerprint()
+    snapshot = _read_snapshot(fingerprint) if use_snapshot else None
+    streaming = _use_streaming()
+    if snapshot is not None and snapshot["streaming"] == streaming:
+        # The stored canonical table is recomputed on use if the taxonomy changed since
+        index = SkillIndex(
+            snapshot["vocab"], snapshot["entry_codes"], snapshot["row_offsets"], snapshot["canonical"]
+        )
+        df = snapshot["frame"]
+        if not streaming:
+            df["skill_list"] = index.skill_lists()
+        return InternshipDataset(df, index, snapshot["sha256"], snapshot["fingerprint"], streaming)
+
+    if streaming:
+        df, index = _stream_internships_csv()
+    else:
+        df = _read_internships_csv()
+        index = SkillIndex.from_skill_lists(df["skill_list"])
+    dataset = InternshipDataset(df, index, _csv_sha256(fingerprint["size"])[0], fingerprint, streaming)
+    _save_snapshot(dataset)
+    return dataset
+
+
+def _append_new_rows(dataset: InternshipDataset, fingerprint: dict) -> InternshipDataset | None:
+    """
+    If the CSV only grew by appended lines since `dataset` was built, parse
+    just those lines and return a new dataset extending the old one (skill
+    codes are appended to the existing index). Returns None when the change
+    is anything other than a clean append.
+    """
+    old_size = dataset.fingerprint["size"]
+    if fingerprint["size"] <= old_size or dataset.streaming != _use_streaming():
+        return None
+
+    prefix_hash, full_hash = _csv_sha256(old_size)
+    with open(CSV_PATH, "rb") as f:
+        f.seek(old_size - 1)
+        ends_with_newline = f.read(1) == b"\n"
+    if prefix_hash != dataset.version or not ends_with_newline:
+        return None
+
+    builder = SkillIndexBuilder.from_index(dataset.skill_index)
+    if dataset.streaming:
+        # Same bounded-memory chunked pass as the full streaming ingest
+        tail_role, tail_stipends, builder = _stream_csv_columns(old_size, builder)
+        role = union_categoricals([dataset.df["role"].array, tail_role])
+        stipends = np.concatenate([dataset.df["stipend_value"].to_numpy(dtype=np.float64), tail_stipends])
+        df = _compact_frame(role, stipends)
+    else:
+        # Small CSVs keep every column; the tail is below STREAMING_MIN_BYTES too
+        header = pd.read_csv(CSV_PATH, encoding="utf-8", nrows=0).columns
+        with open(CSV_PATH, "rb") as f:
+            f.seek(old_size)
+            tail = pd.read_csv(f, encoding="utf-8", header=None, names=list(header))
+        tail.columns = [_normalize_column(c) for c in tail.columns]
+        tail = _prepare_frame(tail)
+        builder.add(tail["skill_list"])
+        df = pd.concat([dataset.df, tail], ignore_index=True)
+
+    return InternshipDataset(df, builder.build(), full_hash, fingerprint, dataset.streaming)
+
+
+def _refresh_dataset(
+    current: InternshipDataset | None, fingerprint: dict, force: bool
+) -> tuple[InternshipDataset, dict]:
+    """
+    HotReloader build step: appended rows are parsed on their own and added
+    to the current indexes; any other change (or `force`) rebuilds from
+    scratch (from the snapshot when it is still valid, unless forced).
+    """
+    started = time.perf_counter()
+    updated = None if force or current is None else _append_new_rows(current, fingerprint)
+    if updated is not None:
+        mode = "append"
+        _save_snapshot(updated)
+    else:
+        mode = "rebuild"
+        updated = _build_dataset(use_snapshot=not force)
+    added = len(updated.df) - (len(current.df) if current is not None else 0)
+
+    if current is not None:
+        print(f"🔄 Internships dataset {mode}: {len(updated.df)} rows "
+              f"({added:+d}) in {time.perf_counter() - started:.2f}s")
+    return updated, {"mode": mode, "added_rows": added, **updated.summary()}
+
+
+_DATASET = HotReloader(
+    "Internships dataset", lambda: CSV_PATH, _refresh_dataset, RELOAD_CHECK_SECONDS, background=True
+)
+
+
+def reload_dataset(force: bool = False) -> dict:
+    """
+    Pick up changes to the CSV without restarting the worker (see
+    _refresh_dataset). The new dataset is swapped in atomically and the
+    snapshot refreshed.
+    """
+    result = _DATASET.reload(force)
+    if result is None:
+        return {"mode": "unchanged", "added_rows": 0, **_DATASET.value.summary()}
+    return result
+
+
+def load_dataset() -> InternshipDataset:
+    """
+    The current internships dataset. Loaded on first use; after that the CSV
+    is checked at most every RELOAD_CHECK_SECONDS and, if it changed, reloaded
+    in a background thread while requests keep using the current dataset.
+    """
+    if _DATASET.value is None and not os.path.exists(CSV_PATH):
+        raise FileNotFoundError(f"CSV file not found at {CSV_PATH}")
+    return _DATASET.get()
+
+
+def load_internships_df() -> pd.DataFrame:
+    """
+    Preprocessed internships dataframe (see load_dataset).
+    """
+    return load_dataset().df
+
+
+def load_skill_index() -> SkillIndex:
+    """
+    Skill index matching the rows of load_internships_df().
+    """
+    return load_dataset().skill_index
+
+
+def get_skill_resolver() -> SkillResolver:
+    """
+    Skill resolver that also knows the current dataset vocabulary, so user
+    skills resolve to the spellings the internship counts use.
+    """
+    return load_dataset().skill_resolver
+
+
+class QueryCache:
+    """
+    Small thread-safe LRU cache with a TTL for per-role query results.
+    Entries are tied to the dataset version, so results computed against an
+    older snapshot are never served after the data changes. `compute`
+    receives the dataset the lookup was made against, so a reload in the
+    middle of a computation cannot mix two versions.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(
+        self,
+        key: Callable[["InternshipDataset"], tuple],
+        compute: Callable[["InternshipDataset", tuple], object],
+    ) -> object:
+        """
+        `key(dataset)` gives the cache key, so inputs resolving to the same
+        query (e.g. every role matching nothing) share one entry; on a miss
+        `compute(dataset, key)` makes the value.
+        """
+        dataset = load_dataset()
+        version = dataset.version
+        key = key(dataset)
+        now = time.monotonic()
+
+        with self._lock:
+            if version != self._version:
+                # New dataset: everything cached so far is stale
+                self._entries.clear()
+                self._version = version
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = compute(dataset, key)
+
+        with self._lock:
+            if version == self._version:
+                self._entries[key] = (now, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_QUERY_CACHE = QueryCache(QUERY_CACHE_SIZE, QUERY_CACHE_TTL)
+
+
+def get_query_cache_stats() -> dict:
+    """
+    Hit/miss counters of the per-role statistics cache.
+    """
+    return _QUERY_CACHE.stats()
+
+
+def _skill_frequency(skill_index: SkillIndex, rows: np.ndarray) -> Dict[str, int]:
+    """
+    Count how many of the given internships mention each skill, most frequent first.
+    """
+    ids, counts = skill_index.ranked_counts(rows)
+    return {skill_index.vocab[i]: int(c) for i, c in zip(ids, counts)}
+
+
+def _role_lookup_key(dataset: InternshipDataset, target_role: str | None) -> str:
+    """
+    Normalized key used against the role index. Roles with no matching rows
+    resolve to "" (which matches every row), so we still use the dataset.
     """
     if not target_role:
-        return df
+        return ""
     key = target_role.lower().strip()
-    df_role = df[df["role_norm"].str.contains(key, na=False)]
-    # If no direct match, use all roles instead of empty
-    return df_role if not df_role.empty else df
+    # Plain substring match (not a regex), resolved through the role index
+    if not dataset.role_index.count_matching(key):
+        return ""
+    return key
+
+
+def _filter_by_role(dataset: InternshipDataset, target_role: str | None) -> pd.DataFrame:
+    """
+    Filter internships by role keyword if provided.
+    If no rows match, return the full dataframe so we still use the dataset.
+    """
+    key = _role_lookup_key(dataset, target_role)
+    if not key:
+        return dataset.df
+    return dataset.df.take(dataset.role_index.rows_matching(key))
+
+
+class RoleStats:
+    """
+    Everything the trends and roadmap stages need for one role, computed in
+    a single pass: the full ranked skill counts plus the role's stipends in
+    ascending order. High-stipend rankings are derived per percentile with a
+    binary search over those stipends and memoized, so callers can ask for
+    0.5, 0.8, 0.9, ... without re-filtering the dataset.
+    """
+
+    def __init__(
+        self,
+        skill_index: SkillIndex,
+        role_key: str,
+        general: List[tuple],
+        sorted_stipends: np.ndarray,
+        rows_by_stipend: np.ndarray,
+        percentile: float = 0.8,
+    ):
+        self.skill_index = skill_index
+        # Resolved role lookup key ("" = every row), shared by all inputs resolving to it
+        self.role_key = role_key
+        self.general = general
+        self.sorted_stipends = sorted_stipends
+        self.rows_by_stipend = rows_by_stipend
+        self.percentile = percentile
+        self._high: Dict[float, tuple] = {}
+
+    @property
+    def row_count(self) -> int:
+        return len(self.rows_by_stipend)
+
+    def high_stipend_at(self, percentile: float) -> tuple[float, np.ndarray, List[tuple]]:
+        """
+        (threshold, qualifying row ids, ranked skill counts) for internships
+        with stipend >= the given percentile of this role.
+        """
+        cached = self._high.get(percentile)
+        if cached is not None:
+            return cached
+        if not self.row_count:
+            return 0.0, self.rows_by_stipend, []
+
+        threshold = _quantile_sorted(self.sorted_stipends, percentile)
+        start = np.searchsorted(self.sorted_stipends, threshold, side="left")
+        rows = self.rows_by_stipend[start:]
+        ranked = list(_skill_frequency(self.skill_index, rows).items()) if len(rows) else []
+        result = (threshold, rows, ranked)
+        self._high[percentile] = result
+        return result
+
+    @property
+    def threshold(self) -> float:
+        return self.high_stipend_at(self.percentile)[0]
+
+    @property
+    def high_row_count(self) -> int:
+        return len(self.high_stipend_at(self.percentile)[1])
+
+    @property
+    def high_stipend(self) -> List[tuple]:
+        return self.high_stipend_at(self.percentile)[2]
+
+    def _items(self, ranked: List[tuple], canonical: bool) -> List[dict]:
+        if not canonical:
+            return [{"skill": s, "count": c} for s, c in ranked]
+        display_name = self.skill_index.display_name
+        return [{"skill": display_name(s), "count": c} for s, c in ranked]
+
+    def trending(self, top_n: int, canonical: bool = False) -> List[dict]:
+        """Top skills for the role; `canonical` swaps in the display names."""
+        return self._items(self.general[:top_n], canonical)
+
+    def high_stipend_skills(
+        self, top_n: int, percentile: float | None = None, canonical: bool = False
+    ) -> List[dict]:
+        ranked = self.high_stipend_at(self.percentile if percentile is None else percentile)[2]
+        return self._items(ranked[:top_n], canonical)
+
+
+def _compute_role_stats(dataset: InternshipDataset, key: str) -> RoleStats:
+    role_index = dataset.role_index
+    sorted_stipends, rows_by_stipend = role_index.stipends_matching(key)
+    print("[TREND DEBUG]", "role key:", repr(key), "rows:", len(rows_by_stipend))
+
+    general = _skill_frequency(dataset.skill_index, role_index.rows_matching(key))
+    return RoleStats(
+        dataset.skill_index,
+        key,
+        list(general.items()),
+        sorted_stipends,
+        rows_by_stipend,
+    )
+
+
+def get_role_stats(target_role: str | None = None) -> RoleStats:
+    """
+    Cached RoleStats for a role (see QueryCache), keyed on the role's
+    resolved lookup key: roles matching the same rows share one entry.
+    """
+    return _QUERY_CACHE.get_or_compute(
+        lambda dataset: ("role_stats", _role_lookup_key(dataset, target_role)),
+        lambda dataset, key: _compute_role_stats(dataset, key[1]),
+    )
 
 
 def get_trending_skills(
@@ -123,15 +1056,7 @@ def get_trending_skills(
     Trending skills = most frequent skills in internships (optionally for a specific role).
     Returns list of { "skill": <str>, "count": <int> }.
     """
-    df = load_internships_df()
-    df_role = _filter_by_role(df, target_role)
-    print("[TREND DEBUG]", "target_role:", target_role, "rows:", len(df_role))
-    if df_role.empty:
-        return []
-
-    counts = _skill_frequency(df_role)
-    ranked = sorted(counts.items(), key=lambda x: x[1], reverse=True)[:top_n]
-    return [{"skill": s, "count": int(c)} for s, c in ranked]
+    return get_role_stats(target_role).trending(top_n)
 
 
 def get_high_stipend_skills(
@@ -143,21 +1068,7 @@ def get_high_stipend_skills(
     High‑stipend skills = most frequent skills among the top X% highest‑stipend internships.
     percentile=0.8 means we keep only internships with stipend >= 80th percentile.
     """
-    df = load_internships_df()
-    df_role = _filter_by_role(df, target_role)
-
-    if df_role.empty:
-        return []
-
-    threshold = df_role["stipend_value"].quantile(percentile)
-    df_high = df_role[df_role["stipend_value"] >= threshold]
-
-    if df_high.empty:
-        return []
-
-    counts = _skill_frequency(df_high)
-    ranked = sorted(counts.items(), key=lambda x: x[1], reverse=True)[:top_n]
-    return [{"skill": s, "count": int(c)} for s, c in ranked]
+    return get_role_stats(target_role).high_stipend_skills(top_n, percentile)
 
 
 def suggest_missing_skills(
@@ -167,8 +1078,11 @@ def suggest_missing_skills(
 ) -> List[str]:
     """
     From trending skills, remove ones the user already has. Result = skill gap suggestions.
+    The user's skills are matched by canonical id, so aliases count ("reactjs" covers "react").
     """
-    current = {s.lower() for s in current_skills}
-    trends = get_trending_skills(target_role=target_role, top_n=100)
-    missing = [t["skill"] for t in trends if t["skill"] not in current]
+    role_stats = get_role_stats(target_role)
+    skill_index = role_stats.skill_index
+    owned = set(skill_index.codes_for(current_skills).tolist())
+    trends = role_stats.trending(100)
+    missing = [t["skill"] for t in trends if skill_index.skill_codes[t["skill"]] not in owned]
     return missing[:top_n]
\ No newline at end of file
@@ -0,0 +1,251 @@
+# local_repo.py
+"""
+Local repositories for offline skill analysis.
+
+LocalRepository exposes, for a checkout on disk (a git clone or any source
+directory) or a tarball, the small part of the PyGithub Repository API the
+evidence pipeline uses: project metadata, get_languages, get_topics,
+get_git_tree(recursive=True) and get_git_blob. collect_repo_evidence can
+then analyze it exactly like a GitHub repository, without any API calls.
+
+In a git checkout only tracked files are listed (`git ls-files`), so
+ignored and untracked files (.env, credentials, local data dumps) are
+neither sampled nor counted, just as on GitHub; any other directory is
+listed with one os.scandir walk. Dotfiles are never listed. Files are read
+only when selected for scanning. Blob SHAs are computed the way git does,
+so scan results are shared through BLOB_CACHE with the same files seen on
+GitHub.
+"""
+import hashlib
+import os
+import shutil
+import stat
+import subprocess
+import tarfile
+import tempfile
+from datetime import datetime, timezone
+
+# Never listed (or counted as language bytes): VCS metadata, dependencies,
+# build output and virtualenvs
+LOCAL_SKIP_DIRS = {
+    ".git", ".hg", ".svn", "node_modules", "dist", "build", ".next", "vendor",
+    "venv", ".venv", "env", "__pycache__", "target", ".idea", ".vscode",
+}
+
+# File extension -> language, following GitHub Linguist's names so local
+# byte counts land on the same skills as GitHub's get_languages()
+LANGUAGE_EXTENSIONS = {
+    ".py": "Python", ".ipynb": "Jupyter Notebook",
+    ".js": "JavaScript", ".jsx": "JavaScript", ".mjs": "JavaScript", ".cjs": "JavaScript",
+    ".ts": "TypeScript", ".tsx": "TypeScript",
+    ".html": "HTML", ".htm": "HTML", ".css": "CSS", ".scss": "SCSS", ".sass": "Sass", ".less": "Less",
+    ".vue": "Vue", ".svelte": "Svelte",
+    ".java": "Java", ".kt": "Kotlin", ".kts": "Kotlin", ".scala": "Scala", ".groovy": "Groovy",
+    ".c": "C", ".h": "C", ".cpp": "C++", ".cc": "C++", ".cxx": "C++", ".hpp": "C++",
+    ".cs": "C#", ".go": "Go", ".rs": "Rust", ".rb": "Ruby", ".php": "PHP",
+    ".swift": "Swift", ".m": "Objective-C", ".dart": "Dart", ".lua": "Lua", ".r": "R",
+    ".sh": "Shell", ".bash": "Shell", ".ps1": "PowerShell", ".sol": "Solidity",
+}
+
+TARBALL_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+
+
+def git_blob_sha(data: bytes) -> str:
+    """The SHA git (and GitHub) gives a file with this content."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+class LocalTreeEntry:
+    """A GitTreeElement look-alike; the blob SHA is computed on first use."""
+
+    def __init__(self, repo, path: str, type: str, size: int | None):
+        self.repo = repo
+        self.path = path
+        self.type = type
+        self.size = size
+        self._sha = None
+
+    @property
+    def sha(self) -> str:
+        if self._sha is None:
+            if self.type == "tree":
+                self._sha = "tree:" + self.path
+            else:
+                data = self.repo.read_bytes(self.path)
+                self._sha = git_blob_sha(data)
+                self.repo._paths_by_sha.setdefault(self._sha, self.path)
+                # Kept until get_git_blob so a scanned file is read only once
+                self.repo._unread[self._sha] = data
+        return self._sha
+
+
+class LocalTree:
+    def __init__(self, entries):
+        self.tree = entries
+        self.raw_data = {"truncated": False}
+
+
+class LocalBlob:
+    def __init__(self, data: bytes):
+        self.encoding = "utf-8"
+        self.content = data.decode("utf-8", "ignore")
+        self.size = len(data)
+
+
+class LocalRepository:
+    """A source directory analyzed like a GitHub repository (see module docstring)."""
+
+    def __init__(self, root: str, name: str | None = None):
+        self.root = os.path.abspath(root)
+        self.name = name or os.path.basename(self.root.rstrip(os.sep))
+        self.full_name = f"local/{self.name}"
+        self.description = None
+        self.html_url = self.root
+        self.stargazers_count = 0
+        self.forks_count = 0
+        self.default_branch = None
+        self._paths_by_sha = {}
+        self._unread = {}
+        self._entries = None
+        self.updated_at = None
+
+    def _git_files(self):
+        """Tracked files of a git checkout, in index order; None if root is not one."""
+        if not os.path.exists(os.path.join(self.root, ".git")):
+            return None
+        try:
+            result = subprocess.run(
+                # fsmonitor is the one setting that makes ls-files run a command
+                ["git", "-c", "core.fsmonitor=false", "-C", self.root, "ls-files", "-z"],
+                capture_output=True, check=True, timeout=60,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"⚠️ {self.full_name}: git ls-files failed, listing every file instead: {e}")
+            return None
+        return [path for path in result.stdout.decode("utf-8", "surrogateescape").split("\0") if path]
+
+    def _scan_files(self):
+        """Every file under root, sorted in git tree order (depth first)."""
+        paths = []
+
+        def visit(directory, prefix):
+            with os.scandir(directory) as it:
+                children = sorted(it, key=lambda e: e.name + "/" if e.is_dir(follow_symlinks=False) else e.name)
+            for child in children:
+                if child.is_symlink():
+                    continue
+                if child.is_dir():
+                    if child.name not in LOCAL_SKIP_DIRS:
+                        visit(child.path, prefix + child.name + "/")
+                elif child.is_file():
+                    paths.append(prefix + child.name)
+
+        visit(self.root, "")
+        return paths
+
+    def _walk(self):
+        """Every listed file and its directories in git tree order (sorted, depth first)."""
+        if self._entries is not None:
+            return self._entries
+        paths = self._git_files()
+        if paths is None:
+            paths = self._scan_files()
+
+        entries = []
+        listed_dirs = set()
+        latest = 0.0
+        for path in paths:
+            *dirs, name = path.split("/")
+            if name.startswith(".") or any(d in LOCAL_SKIP_DIRS for d in dirs):
+                continue
+            try:
+                info = os.lstat(os.path.join(self.root, path))
+            except OSError:
+                continue    # tracked but deleted from the working tree
+            if not stat.S_ISREG(info.st_mode):
+                continue    # symlinks, submodules
+            for depth in range(1, len(dirs) + 1):
+                directory = "/".join(dirs[:depth])
+                if directory not in listed_dirs:
+                    listed_dirs.add(directory)
+                    entries.append(LocalTreeEntry(self, directory, "tree", None))
+            latest = max(latest, info.st_mtime)
+            entries.append(LocalTreeEntry(self, path, "blob", info.st_size))
+
+        self._entries = entries
+        self.updated_at = datetime.fromtimestamp(latest, timezone.utc) if latest else None
+        return entries
+
+    def read_bytes(self, path: str) -> bytes:
+        with open(os.path.join(self.root, path), "rb") as f:
+            return f.read()
+
+    # ---- PyGithub Repository subset ----------------------------------------
+
+    def get_languages(self) -> dict:
+        """{language: bytes}, largest first, like GitHub's languages endpoint."""
+        totals = {}
+        for entry in self._walk():
+            if entry.type != "blob":
+                continue
+            language = LANGUAGE_EXTENSIONS.get(os.path.splitext(entry.path)[1].lower())
+            if language:
+                totals[language] = totals.get(language, 0) + entry.size
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+    def get_topics(self) -> list:
+        return []
+
+    def get_git_tree(self, ref=None, recursive=True) -> LocalTree:
+        return LocalTree(self._walk())
+
+    def get_git_blob(self, sha: str) -> LocalBlob:
+        data = self._unread.pop(sha, None)
+        if data is None:
+            data = self.read_bytes(self._paths_by_sha[sha])
+        return LocalBlob(data)
+
+
+def is_tarball(path: str) -> bool:
+    return os.path.isfile(path) and path.lower().endswith(TARBALL_SUFFIXES)
+
+
+class open_local_repository:
+    """
+    Context manager giving a LocalRepository for a directory or a tarball.
+    Tarballs are extracted to a temporary directory (removed on exit); a
+    single top-level directory, as in GitHub's source archives, is the root.
+
+        with open_local_repository("submissions/alice.tar.gz") as repo:
+            evidence = collect_repo_evidence(repo)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._tmpdir = None
+
+    def __enter__(self) -> LocalRepository:
+        if os.path.isdir(self.path):
+            return LocalRepository(self.path)
+        if not is_tarball(self.path):
+            raise ValueError(f"Not a directory or tarball: {self.path}")
+
+        self._tmpdir = tempfile.mkdtemp(prefix="skill-gap-repo-")
+        with tarfile.open(self.path) as tar:
+            tar.extractall(self._tmpdir, filter="data")
+        root = self._tmpdir
+        children = os.listdir(root)
+        if len(children) == 1 and os.path.isdir(os.path.join(root, children[0])):
+            root = os.path.join(root, children[0])
+
+        name = os.path.basename(self.path)
+        for suffix in TARBALL_SUFFIXES:
+            if name.lower().endswith(suffix):
+                name = name[:-len(suffix)]
+                break
+        return LocalRepository(root, name=name)
+
+    def __exit__(self, *exc):
+        if self._tmpdir:
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+        return False
@@ -0,0 +1,477 @@
+# skill_taxonomy.py
+"""
+Skill taxonomy shared by the GitHub analysis (ai_utils) and the internships
+dataset (internship_data).
+
+The data lives in skill_taxonomy.json: canonical skill names (alias ->
+display name, grouped by category) and skill dependencies with their
+difficulty-based boost factors. It is compiled into a SkillTaxonomy (alias
+map, dependency adjacency, topological order and transitive closures)
+stamped with a version, the hash of the file. Edits to the file are picked
+up at runtime: the new tables are compiled off to the side and swapped in
+with a single assignment, and caches built from the taxonomy (skill
+resolvers, the internships canonical-name table) are keyed on the version.
+"""
+import hashlib
+import json
+import os
+import re
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+from hot_reload import HotReloader
+
+TAXONOMY_PATH = os.getenv(
+    "SKILL_TAXONOMY_PATH",
+    os.path.join(os.path.dirname(__file__), "skill_taxonomy.json"),
+)
+
+# How often (seconds) the taxonomy file is checked for changes; -1 disables
+TAXONOMY_RELOAD_CHECK_SECONDS = float(os.getenv("SKILL_TAXONOMY_RELOAD_CHECK_SECONDS", "30"))
+
+
+def normalize_skill_name(skill_name):
+    """Normalize skill names for case-insensitive comparison"""
+    if not skill_name:
+        return ""
+    return skill_name.strip().lower()
+
+
+def is_partial_skill_match(norm1, norm2):
+    """
+    Compound/partial rule: one normalized name contains the other as whole
+    word(s) (e.g. 'node' / 'node.js', 'spring' / 'spring boot', but not
+    'java' / 'javascript'). Only used when no exact/alias match exists.
+    """
+    short, long = sorted((norm1, norm2), key=len)
+    if not short:
+        return False
+    return re.search(rf"(?<![a-z0-9+#]){re.escape(short)}(?![a-z0-9+#])", long) is not None
+
+
+def skill_tokens(normalized_skill):
+    """Word tokens of a normalized skill name ('+' and '#' count as letters)."""
+    return re.findall(r"[a-z0-9+#]+", normalized_skill)
+
+
+class SkillLookup:
+    """
+    Index over a set of skill names for repeated skills_match-style lookups.
+    Exact and alias matches are a dict hit on the canonical id. For the
+    partial rule, names are also indexed by word token: a whole-word match
+    always shares a token with the other name, so only the names sharing one
+    of the query's tokens are checked instead of every indexed name.
+    """
+
+    def __init__(self, names=(), skill_id=None):
+        self._skill_id = skill_id or canonical_skill_id
+        self._by_id = {}
+        self._normalized = []
+        self._by_token = {}
+        self._untokenized = []
+        for name in names:
+            self.add(name)
+
+    def add(self, name):
+        self._by_id.setdefault(self._skill_id(name), name)
+        normalized = normalize_skill_name(name)
+        position = len(self._normalized)
+        self._normalized.append((normalized, name))
+        tokens = skill_tokens(normalized)
+        if not tokens:
+            self._untokenized.append(position)
+        for token in set(tokens):
+            self._by_token.setdefault(token, []).append(position)
+
+    def find_exact(self, skill_name):
+        """The first indexed name with the same canonical id as `skill_name`, or None."""
+        return self._by_id.get(self._skill_id(skill_name))
+
+    def partial_matches(self, skill_name):
+        """Indexed names matching `skill_name` under the partial rule, in the order added."""
+        normalized = normalize_skill_name(skill_name)
+        tokens = set(skill_tokens(normalized))
+        if tokens:
+            positions = set(self._untokenized)
+            for token in tokens:
+                positions.update(self._by_token.get(token, ()))
+            positions = sorted(positions)
+        else:
+            # Punctuation-only input can sit between any two words
+            positions = range(len(self._normalized))
+        for position in positions:
+            candidate_norm, name = self._normalized[position]
+            if is_partial_skill_match(normalized, candidate_norm):
+                yield name
+
+    def find(self, skill_name):
+        """The indexed name matching `skill_name`, or None."""
+        match = self.find_exact(skill_name)
+        if match is not None:
+            return match
+        return next(self.partial_matches(skill_name), None)
+
+
+class SkillStatusMatcher:
+    """
+    Decides a trend skill's status for one student ('verified',
+    'claimed_no_evidence' or 'not_learned').
+
+    Built once from the student's GitHub, claimed, verified and
+    claimed-without-evidence skills, each set as a SkillLookup (canonical id
+    for exact/alias matches, word tokens for partial-rule candidates), so
+    classifying a skill is a few dict lookups instead of scanning all four sets.
+    """
+
+    GITHUB = 1
+    CLAIMED = 2
+    VERIFIED = 4
+    NO_EVIDENCE = 8
+
+    STATUS_MESSAGES = {
+        'verified': '✅ You already have this skill (verified in GitHub)',
+        'claimed_no_evidence': '⚠️ Claimed but no evidence found in GitHub',
+        'not_learned': '📚 Consider learning this skill',
+    }
+
+    def __init__(self, github_skills=(), user_skills=(), verified_skills=(), claimed_no_evidence_skills=()):
+        self._lookups = [
+            (flag, SkillLookup(skill for skill in skills if normalize_skill_name(skill)))
+            for skills, flag in (
+                (github_skills, self.GITHUB),
+                (user_skills, self.CLAIMED),
+                (verified_skills, self.VERIFIED),
+                (claimed_no_evidence_skills, self.NO_EVIDENCE),
+            )
+        ]
+
+    @classmethod
+    def from_portfolio(cls, data):
+        """Matcher for a generated portfolio payload (used by the renderers)."""
+        proficiency = data.get('proficiency_analysis', {}) or {}
+        github_skills = [
+            s.get('name', '') for s in proficiency.get('skills', []) if s.get('has_github_evidence')
+        ]
+        return cls(
+            github_skills,
+            data.get('skills', []) or [],
+            proficiency.get('github_verified_skills', []),
+            proficiency.get('claimed_no_evidence_skills', []),
+        )
+
+    def match_flags(self, skill):
+        """Bitmask of the sets containing `skill` (exact, alias or partial match)."""
+        flags = 0
+        for flag, lookup in self._lookups:
+            if lookup.find(skill) is not None:
+                flags |= flag
+        return flags
+
+    def status(self, skill):
+        flags = self.match_flags(skill)
+        if flags & (self.GITHUB | self.VERIFIED):
+            return 'verified'
+        if flags & (self.NO_EVIDENCE | self.CLAIMED):
+            return 'claimed_no_evidence'
+        return 'not_learned'
+
+    def mark_trends(self, trends, overwrite=True):
+        """Set has_skill / skill_status / status_message on every trend in one pass."""
+        for trend in trends:
+            if not overwrite and trend.get('skill_status'):
+                continue
+            status = self.status(trend.get('skill', ''))
+            trend['has_skill'] = status != 'not_learned'
+            trend['skill_status'] = status
+            trend['status_message'] = self.STATUS_MESSAGES[status]
+        return trends
+
+
+class SkillDependencyGraph:
+    """
+    The dependency table compiled into a graph: nodes are canonical skill
+    ids, edges go parent -> dependency with their boost factor, `order` is a
+    topological order (every parent before its dependencies) and
+    `closure[node]` holds every direct or indirect dependency of a node.
+    Boosts pushed through the nodes in that order reach indirect
+    dependencies too (Kubernetes -> Docker -> Linux) in a single pass.
+    """
+
+    def __init__(self, dependencies, skill_id, display_name):
+        self.names = {}
+        self.children = {}
+        parent_ids = {}
+
+        for parent, deps in dependencies.items():
+            parent_id = skill_id(parent)
+            self.names.setdefault(parent_id, display_name(parent))
+            parent_ids[parent] = parent_id
+            edges = self.children.setdefault(parent_id, [])
+            for dep, factor in deps.items():
+                dep_id = skill_id(dep)
+                self.names.setdefault(dep_id, display_name(dep))
+                self.children.setdefault(dep_id, [])
+                edges.append((dep_id, factor))
+
+        self._parent_ids = parent_ids
+        self._parents = SkillLookup(dependencies.keys(), skill_id)
+        self.order = self._topological_order()
+
+        self.closure = {}
+        for node in reversed(self.order):
+            reachable = set()
+            for child, _ in self.children[node]:
+                reachable.add(child)
+                reachable |= self.closure[child]
+            self.closure[node] = frozenset(reachable)
+
+    def _topological_order(self):
+        indegree = {node: 0 for node in self.children}
+        for edges in self.children.values():
+            for child, _ in edges:
+                indegree[child] += 1
+
+        order = []
+        ready = [node for node, degree in indegree.items() if degree == 0]
+        while ready:
+            node = ready.pop(0)
+            order.append(node)
+            for child, _ in self.children[node]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    ready.append(child)
+
+        if len(order) != len(self.children):
+            cyclic = sorted(self.names[n] for n, degree in indegree.items() if degree > 0)
+            raise ValueError(f"Skill dependencies contain a cycle through: {cyclic}")
+        return order
+
+    def node_for(self, skill_name):
+        """Graph node whose dependencies a skill boosts, or None."""
+        parent = self._parents.find(skill_name)
+        return self._parent_ids[parent] if parent is not None else None
+
+    def propagation_order(self, start_nodes):
+        """The part of `order` reachable from `start_nodes` (boost sources)."""
+        reachable = set(start_nodes)
+        for node in start_nodes:
+            reachable |= self.closure[node]
+        return [node for node in self.order if node in reachable]
+
+
+def _flatten_groups(groups):
+    """Category -> {key: value} sections of the data file, merged in file order."""
+    flat = {}
+    for section in groups.values():
+        flat.update(section)
+    return flat
+
+
+class SkillTaxonomy:
+    """
+    One compiled version of the taxonomy file. Never modified after
+    construction; a reload builds a new instance and swaps it in.
+    """
+
+    def __init__(self, data, version):
+        self.version = version
+        self.canonical_names = _flatten_groups(data["canonical_names"])
+        self.dependencies = _flatten_groups(data["dependencies"])
+
+        # Every alias and every canonical name (normalized) -> canonical id, where
+        # the id is the normalized canonical name: 'reactjs', 'react.js', 'react' -> 'react'
+        self.alias_ids = {}
+        for alias, canonical in self.canonical_names.items():
+            self.alias_ids[normalize_skill_name(alias)] = normalize_skill_name(canonical)
+        for canonical in self.canonical_names.values():
+            self.alias_ids.setdefault(normalize_skill_name(canonical), normalize_skill_name(canonical))
+
+        self.dependency_graph = SkillDependencyGraph(self.dependencies, self.skill_id, self.canonicalize)
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, "rb") as f:
+            raw = f.read()
+        return cls(json.loads(raw.decode("utf-8")), hashlib.sha256(raw).hexdigest()[:16])
+
+    def skill_id(self, skill_name):
+        normalized = normalize_skill_name(skill_name)
+        return self.alias_ids.get(normalized, normalized)
+
+    def canonicalize(self, skill_name):
+        if not skill_name:
+            return skill_name
+
+        normalized = normalize_skill_name(skill_name)
+
+        # Check if we have a canonical name for this skill
+        if normalized in self.canonical_names:
+            return self.canonical_names[normalized]
+
+        # If not in our dictionary, apply smart capitalization
+        # Keep all uppercase if it looks like an acronym (2-4 chars, all letters)
+        if len(skill_name) <= 4 and skill_name.isalpha():
+            return skill_name.upper()
+
+        # Title case for other skills
+        return skill_name.strip().title()
+
+    def summary(self):
+        return {
+            "version": self.version,
+            "canonical_names": len(self.canonical_names),
+            "dependencies": len(self.dependencies),
+        }
+
+
+def _compile_taxonomy(current, fingerprint, force):
+    """HotReloader build step; a file with the same content keeps the current version."""
+    updated = SkillTaxonomy.from_file(TAXONOMY_PATH)
+    if current is not None and updated.version == current.version:
+        return current, {"mode": "unchanged", **current.summary()}
+    if current is not None:
+        print(f"🔄 Skill taxonomy reloaded: version {updated.version}")
+    return updated, {"mode": "reload", **updated.summary()}
+
+
+_TAXONOMY = HotReloader("Skill taxonomy", lambda: TAXONOMY_PATH, _compile_taxonomy, TAXONOMY_RELOAD_CHECK_SECONDS)
+
+
+def reload_taxonomy(force=False):
+    """
+    Recompile the taxonomy if its file changed (or `force`). A file that
+    fails to parse or contains a dependency cycle raises and leaves the
+    current taxonomy in place.
+    """
+    result = _TAXONOMY.reload(force)
+    if result is None:
+        return {"mode": "unchanged", **_TAXONOMY.value.summary()}
+    return result
+
+
+def load_taxonomy():
+    """
+    The current SkillTaxonomy. Loaded on first use; after that the file is
+    checked at most every TAXONOMY_RELOAD_CHECK_SECONDS.
+    """
+    return _TAXONOMY.get()
+
+
+def get_taxonomy_version():
+    return load_taxonomy().version
+
+
+def canonicalize_skill_name(skill_name):
+    """
+    Convert a skill name to its canonical (properly formatted) version.
+    E.g., 'html' -> 'HTML', 'react' -> 'React', 'javascript' -> 'JavaScript'
+    """
+    return load_taxonomy().canonicalize(skill_name)
+
+
+def canonical_skill_id(skill_name):
+    """
+    O(1) canonical id for a skill name. Two names share an id exactly when
+    they canonicalize to the same skill; unknown skills map to their
+    normalized form.
+    """
+    return load_taxonomy().skill_id(skill_name)
+
+
+# ===================== FUZZY SKILL RESOLUTION ===================== #
+
+# Minimum similarity (0-1, difflib ratio of the compacted names) for a fuzzy match
+FUZZY_SKILL_CUTOFF = float(os.getenv("SKILL_FUZZY_CUTOFF", "0.85"))
+
+# Shorter names ("c", "r", "go", "sql") are only ever matched exactly
+FUZZY_MIN_LENGTH = 4
+
+
+def compact_skill_key(skill_name):
+    """Lower-case and drop separators: 'React.js', 'react js', 'ReactJS' -> 'reactjs'."""
+    return re.sub(r"[^a-z0-9+#]", "", normalize_skill_name(skill_name))
+
+
+class SkillResolver:
+    """
+    Resolves free-text skill names to canonical display names.
+
+    Known names are the taxonomy (aliases and canonical names) plus any extra
+    (name, display name) pairs such as the internships vocabulary, keyed by
+    their compact form so punctuation and spacing variants hit directly.
+    Anything else is matched fuzzily: a character trigram index narrows the
+    known names down to the few sharing enough trigrams, and the best one
+    scoring at least `cutoff` wins. Results are memoized per resolver, and a
+    resolver belongs to one taxonomy version (see `taxonomy_version`).
+    """
+
+    NGRAM = 3
+
+    def __init__(self, extra_names=(), cutoff=FUZZY_SKILL_CUTOFF, memo_size=8192, taxonomy=None):
+        self.taxonomy = taxonomy or load_taxonomy()
+        self.taxonomy_version = self.taxonomy.version
+        self.cutoff = cutoff
+        self.names = {}
+        for alias, canonical in self.taxonomy.canonical_names.items():
+            self._add(alias, canonical)
+        for canonical in self.taxonomy.canonical_names.values():
+            self._add(canonical, canonical)
+        for name, display in extra_names:
+            self._add(name, display)
+
+        self.keys = list(self.names)
+        self.grams = {}
+        for key_id, key in enumerate(self.keys):
+            if len(key) >= FUZZY_MIN_LENGTH:
+                for gram in self._grams(key):
+                    self.grams.setdefault(gram, []).append(key_id)
+
+        self.resolve_key = lru_cache(maxsize=memo_size)(self._resolve_key)
+
+    def _add(self, name, display):
+        key = compact_skill_key(name)
+        if key:
+            # Taxonomy entries are added first and win over dataset spellings
+            self.names.setdefault(key, display)
+
+    def _grams(self, key):
+        padded = f" {key} "
+        return {padded[i:i + self.NGRAM] for i in range(len(padded) - self.NGRAM + 1)}
+
+    def _resolve_key(self, key):
+        if key in self.names:
+            return self.names[key]
+        if len(key) < FUZZY_MIN_LENGTH:
+            return None
+
+        grams = self._grams(key)
+        shared = {}
+        for gram in grams:
+            for key_id in self.grams.get(gram, ()):
+                shared[key_id] = shared.get(key_id, 0) + 1
+
+        # Dice over trigrams bounds the edit similarity loosely; only keep
+        # candidates that share a reasonable fraction before the exact score
+        min_shared = max(1, int(len(grams) * (2 * self.cutoff - 1)))
+        best_score, best_key = self.cutoff, None
+        for key_id, count in shared.items():
+            if count < min_shared:
+                continue
+            candidate = self.keys[key_id]
+            matcher = SequenceMatcher(None, key, candidate, autojunk=False)
+            if matcher.real_quick_ratio() < best_score or matcher.quick_ratio() < best_score:
+                continue
+            score = matcher.ratio()
+            if score > best_score or (score == best_score and best_key is None):
+                best_score, best_key = score, candidate
+        return None if best_key is None else self.names[best_key]
+
+    def resolve(self, skill_name):
+        """Canonical display name for `skill_name`, or None if nothing is close enough."""
+        return self.resolve_key(compact_skill_key(skill_name))
+
+    def canonicalize(self, skill_name):
+        """Like canonicalize_skill_name, but tolerant of spelling variants."""
+        if not skill_name:
+            return skill_name
+        return self.resolve(skill_name) or self.taxonomy.canonicalize(skill_name)
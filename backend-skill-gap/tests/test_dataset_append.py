@@ -0,0 +1,82 @@
+"""
+Reloading a CSV that only grew by appended rows must give the same skill
+index, role index and role stats as building the whole file from scratch,
+in both the streaming and the in-memory ingest.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+import internship_data as data
+
+BASE_ROWS = 400
+TOTAL_ROWS = 700
+
+
+@pytest.fixture(params=[True, False], ids=["streaming", "in-memory"])
+def appended_csv(request, tmp_path, monkeypatch):
+    """(CSV path, text before the append, text after) with module paths pointed at tmp_path."""
+    shipped = pd.read_csv(data.CSV_PATH, encoding="utf-8", nrows=TOTAL_ROWS)
+    base = shipped.head(BASE_ROWS).to_csv(index=False)
+    full = shipped.to_csv(index=False)
+    assert full.startswith(base)
+
+    path = tmp_path / "internships.csv"
+    monkeypatch.setattr(data, "CSV_PATH", str(path))
+    monkeypatch.setattr(data, "SNAPSHOT_PATH", str(tmp_path / "internships.snapshot.pkl"))
+    # Several chunks in the base file and in the appended tail
+    monkeypatch.setattr(data, "STREAMING_CHUNK_ROWS", 64)
+    monkeypatch.setenv("INTERNSHIPS_STREAMING", "1" if request.param else "0")
+    data._DATASET.clear()
+    data._QUERY_CACHE.clear()
+    yield path, base, full
+    data._DATASET.clear()
+    data._QUERY_CACHE.clear()
+
+
+def role_keys(dataset):
+    """Every row, a few whole roles and a substring shared by several roles."""
+    roles = dataset.df["role_norm"].astype(str).value_counts().index[:3].tolist()
+    return ["", "developer", *roles]
+
+
+def test_append_matches_fresh_build(appended_csv):
+    path, base, full = appended_csv
+    path.write_text(base, encoding="utf-8")
+    before = data.load_dataset()
+    before_stats = {key: data._compute_role_stats(before, key) for key in role_keys(before)}
+
+    path.write_text(full, encoding="utf-8")
+    result = data.reload_dataset()
+    assert result["mode"] == "append"
+    assert result["added_rows"] == TOTAL_ROWS - BASE_ROWS
+
+    appended = data.load_dataset()
+    fresh = data._build_dataset(use_snapshot=False)
+    assert appended.streaming == fresh.streaming
+    assert appended.version == fresh.version
+    assert len(appended.df) == len(fresh.df) == TOTAL_ROWS
+
+    a, f = appended.skill_index, fresh.skill_index
+    assert a.vocab.tolist() == f.vocab.tolist()
+    np.testing.assert_array_equal(a.entry_codes, f.entry_codes)
+    np.testing.assert_array_equal(a.row_offsets, f.row_offsets)
+    assert a.canonical_table().names.tolist() == f.canonical_table().names.tolist()
+
+    for key in role_keys(fresh):
+        assert appended.role_index.count_matching(key) == fresh.role_index.count_matching(key)
+        np.testing.assert_array_equal(appended.role_index.rows_matching(key), fresh.role_index.rows_matching(key))
+        for got, expected in zip(appended.role_index.stipends_matching(key), fresh.role_index.stipends_matching(key)):
+            np.testing.assert_array_equal(got, expected)
+
+        got = data._compute_role_stats(appended, key)
+        expected = data._compute_role_stats(fresh, key)
+        assert got.general == expected.general
+        assert got.threshold == expected.threshold
+        assert got.high_stipend == expected.high_stipend
+        assert got.trending(10, canonical=True) == expected.trending(10, canonical=True)
+
+    # The append extended a copy: the dataset it started from is unchanged
+    assert len(before.df) == BASE_ROWS
+    for key, stats in before_stats.items():
+        assert data._compute_role_stats(before, key).general == stats.general
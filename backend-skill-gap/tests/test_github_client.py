@@ -0,0 +1,61 @@
+"""
+A rate-limited GitHub response must surface as GitHubRateLimited at once,
+not be slept through by PyGithub's retry policy.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from github_client import METADATA, GitHubRateLimited, GitHubScheduler, build_github_client
+
+
+class RateLimitedHandler(BaseHTTPRequestHandler):
+    requests = 0
+
+    def do_GET(self):
+        type(self).requests += 1
+        body = json.dumps({"message": "API rate limit exceeded for user ID 1."}).encode()
+        self.send_response(403)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-RateLimit-Limit", "5000")
+        self.send_header("X-RateLimit-Remaining", "0")
+        self.send_header("X-RateLimit-Reset", str(int(time.time()) + 3600))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def github_api():
+    server = HTTPServer(("127.0.0.1", 0), RateLimitedHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    RateLimitedHandler.requests = 0
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def test_primary_rate_limit_raises_promptly(github_api):
+    scheduler = GitHubScheduler(rate=100, burst=10, reserve=0, max_wait=1)
+    scheduler.client = build_github_client("token", base_url=github_api)
+
+    started = time.monotonic()
+    with pytest.raises(GitHubRateLimited) as raised:
+        scheduler.call(METADATA, scheduler.client.get_repo, "alice/demo")
+
+    assert time.monotonic() - started < 5
+    assert RateLimitedHandler.requests == 1
+    assert raised.value.reset_at is not None
+    assert scheduler.remaining == 0
+
+    # Later calls are refused by the scheduler without another request
+    with pytest.raises(GitHubRateLimited):
+        scheduler.call(METADATA, scheduler.client.get_repo, "alice/demo")
+    assert RateLimitedHandler.requests == 1
+
@@ -0,0 +1,84 @@
+"""
+The bulk column parsers must agree with the per-cell parsers they replace,
+on the shipped CSV and on cells that only the per-cell path can handle.
+"""
+import pandas as pd
+import pytest
+
+import internship_data as data
+
+EDGE_SKILL_CELLS = [
+    "['Content Writing', 'MS-Excel', 'Canva']",
+    '["Python", "B\'s skill"]',
+    "[]",
+    "['a',]",
+    "  ['Padded', ' Items ']  ",
+    "['a'\t,\t'b']",
+    "['a\nb']",            # line break inside an item: not a valid literal
+    "['a\rb']",
+    "['a\x00b']",
+    "['a',\xa0'b']",       # NBSP / other non-ASCII whitespace between items
+    "['a', 'b']",
+    "[\xa0'a']",
+    "['a',\n'b']",         # line break between items is a valid literal
+    "\xa0['a', 'b']\xa0",
+    "['escaped \\'quote\\'']",
+    "['implicit' 'concat']",
+    "['', '  ']",
+    "[,]",
+    "Python, SQL; Excel",
+    "plain text",
+    "",
+    None,
+    float("nan"),
+    42,
+]
+
+EDGE_STIPEND_CELLS = [
+    "₹ 5,000-12,000 /month",
+    "₹10,000 /month",
+    "Unpaid",
+    "",
+    None,
+    float("nan"),
+    "1,,",
+    "７,000",              # full-width digits
+    "₹ ٧,٠٠٠ /month",      # Arabic-Indic digits
+    "99999999999999999999999",
+    7000,
+]
+
+
+@pytest.fixture(scope="module")
+def shipped():
+    return pd.read_csv(data.CSV_PATH, encoding="utf-8")
+
+
+def _skills_equal(cells: pd.Series) -> None:
+    bulk = data._parse_skills_column(cells)
+    assert list(bulk.index) == list(cells.index)
+    for cell, parsed in zip(cells, bulk):
+        assert parsed == data._parse_skills_cell(cell), repr(cell)
+
+
+def _stipends_equal(cells: pd.Series) -> None:
+    bulk = data._parse_stipend_column(cells)
+    assert list(bulk.index) == list(cells.index)
+    for cell, parsed in zip(cells, bulk):
+        assert parsed == data._parse_stipend(cell), repr(cell)
+
+
+def test_skills_column_matches_cell_parser_on_shipped_csv(shipped):
+    _skills_equal(shipped["Skills"])
+
+
+def test_skills_column_matches_cell_parser_on_edge_cells():
+    _skills_equal(pd.Series(EDGE_SKILL_CELLS, dtype=object))
+
+
+def test_stipend_column_matches_cell_parser_on_shipped_csv(shipped):
+    _stipends_equal(shipped["Stipend"])
+
+
+def test_stipend_column_matches_cell_parser_on_edge_cells():
+    _stipends_equal(pd.Series(EDGE_STIPEND_CELLS, dtype=object))
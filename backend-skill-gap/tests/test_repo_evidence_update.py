@@ -0,0 +1,181 @@
+"""
+update_repo_evidence (evidence at a new commit from the previous evidence
+and the compare diff) must give the same result as a full scan of the new
+tree, downloading only what changed, and hand back None when the diff
+cannot be applied.
+"""
+import hashlib
+from types import SimpleNamespace
+
+import pytest
+
+import ai_utils
+from github_cache import BlobCache
+from github_client import GitHubScheduler
+
+
+def blob_sha(text):
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+class FakeRepository:
+    """In-memory stand-in for a PyGithub Repository: one file tree per commit."""
+
+    def __init__(self, commits):
+        self.commits = commits  # commit sha -> {path: text}
+        self.name = "demo"
+        self.full_name = "alice/demo"
+        self.default_branch = "main"
+        self.description = "demo repository"
+        self.html_url = "https://github.com/alice/demo"
+        self.stargazers_count = 3
+        self.forks_count = 1
+        self.updated_at = "2026-01-01 00:00:00"
+        self.calls = []
+
+    def get_languages(self):
+        return {"JavaScript": 12000, "Python": 3000}
+
+    def get_topics(self):
+        return ["react"]
+
+    def get_git_tree(self, ref, recursive=False):
+        self.calls.append("tree")
+        files = self.commits[ref]
+        dirs = {"/".join(p.split("/")[:i]) for p in files for i in range(1, p.count("/") + 1)}
+        entries = [
+            SimpleNamespace(path=p, type="tree", size=None, sha="tree-" + p) if p in dirs
+            else SimpleNamespace(path=p, type="blob", size=len(files[p]), sha=blob_sha(files[p]))
+            for p in sorted(set(files) | dirs)
+        ]
+        return SimpleNamespace(tree=entries, raw_data={"truncated": False})
+
+    def get_git_blob(self, sha):
+        self.calls.append("blob")
+        text = next(t for files in self.commits.values() for t in files.values() if blob_sha(t) == sha)
+        return SimpleNamespace(encoding="utf-8", content=text)
+
+    def compare(self, base, head, status="ahead"):
+        old, new = self.commits[base], self.commits[head]
+        changes = []
+        renamed_from = {}
+        for path in sorted(set(new) - set(old)):
+            source = next((p for p in sorted(set(old) - set(new)) if old[p] == new[path]), None)
+            if source is not None and source not in renamed_from.values():
+                renamed_from[path] = source
+        for path in sorted(set(old) | set(new)):
+            if path in renamed_from:
+                changes.append(SimpleNamespace(
+                    filename=path, status="renamed", sha=blob_sha(new[path]), previous_filename=renamed_from[path]
+                ))
+            elif path not in new:
+                if path not in renamed_from.values():
+                    changes.append(SimpleNamespace(filename=path, status="removed", sha=None, previous_filename=None))
+            elif path not in old:
+                changes.append(SimpleNamespace(filename=path, status="added", sha=blob_sha(new[path]), previous_filename=None))
+            elif old[path] != new[path]:
+                changes.append(SimpleNamespace(filename=path, status="modified", sha=blob_sha(new[path]), previous_filename=None))
+        return SimpleNamespace(status=status, files=changes)
+
+
+BASE_FILES = {
+    "README.md": "# Demo\nA react app",
+    "package.json": '{"dependencies": {"react": "^18"}}',
+    "src/App.jsx": "import React, { useState } from 'react'\nexport default function App(){}",
+    "src/util.js": "export const x = 1",
+    "src/Old.jsx": "import React from 'react'\nexport const Old = () => null",
+    "node_modules/react/index.js": "import react",
+    "server/app.py": "from flask import Flask\napp = Flask(__name__)",
+    "server/requirements.txt": "flask\n",
+    **{f"b{i}.py": f"import os  # root file {i}" for i in range(9)},
+}
+
+
+@pytest.fixture(autouse=True)
+def isolated_github(monkeypatch):
+    """A cold blob cache and a scheduler that does not pace the fake calls."""
+    monkeypatch.setattr(ai_utils, "BLOB_CACHE", BlobCache(10 ** 8))
+    monkeypatch.setattr(ai_utils, "GITHUB_SCHEDULER", GitHubScheduler(rate=1000, burst=1000, reserve=0, max_wait=5))
+
+
+def evidence_at(repo, sha):
+    """Full scan of `sha` with a cold blob cache, as the crawl would do it."""
+    ai_utils.BLOB_CACHE._entries.clear()
+    return ai_utils.collect_repo_evidence(repo, ref=sha)
+
+
+def update(commits):
+    """(repository, evidence at c1, evidence updated to c2, API calls the update made)"""
+    repo = FakeRepository(commits)
+    base = evidence_at(repo, "c1")
+    assert base["complete"]
+    repo.calls.clear()
+    ai_utils.BLOB_CACHE._entries.clear()
+    updated = ai_utils.update_repo_evidence(repo, base, "c1", "c2")
+    return repo, base, updated, list(repo.calls)
+
+
+def test_renames_and_deletions_match_full_scan():
+    head = dict(BASE_FILES)
+    head["src/New.jsx"] = head.pop("src/Old.jsx")           # renamed, same content
+    del head["src/util.js"]
+    del head["server/app.py"]
+    head["server/extra.py"] = "from flask import Blueprint"
+    head["server/requirements.txt"] = "flask\nDjango>=4\n"
+    repo, base, updated, calls = update({"c1": BASE_FILES, "c2": head})
+
+    assert updated == evidence_at(repo, "c2")
+    assert "src/Old.jsx" not in updated["files"] and "server/app.py" not in updated["files"]
+    assert updated["files"]["src/New.jsx"]["sha"] == base["files"]["src/Old.jsx"]["sha"]
+    # Relisted once; only the added and modified files were downloaded
+    assert calls == ["tree", "blob", "blob"]
+
+
+def test_modified_files_below_root_reuse_the_selection():
+    head = dict(BASE_FILES)
+    head["src/App.jsx"] = "import React from 'react'\nexport default function App(){ return 1 }"
+    repo, _, updated, calls = update({"c1": BASE_FILES, "c2": head})
+
+    assert updated == evidence_at(repo, "c2")
+    assert calls == ["blob"]
+
+
+def test_root_changes_reselect_the_samples():
+    head = dict(BASE_FILES)
+    # Sorts first at the root, pushing the last of the ROOT_SAMPLE_ENTRIES out
+    head["a.py"] = "from flask import Flask"
+    head["README.md"] = "# Demo\nA react app, now with docs"
+    repo, base, updated, _ = update({"c1": BASE_FILES, "c2": head})
+
+    expected = evidence_at(repo, "c2")
+    assert updated == expected
+    assert updated["code_samples"] != base["code_samples"]
+    assert "a.py" in [s["file"] for s in updated["code_samples"]["py"]]
+
+
+def test_too_many_changed_files_falls_back_to_a_crawl(monkeypatch):
+    head = dict(BASE_FILES)
+    for i in range(3):
+        head[f"src/added{i}.js"] = f"export const y{i} = {i}"
+    monkeypatch.setattr(ai_utils, "GITHUB_COMPARE_MAX_FILES", 3)
+    _, _, updated, calls = update({"c1": BASE_FILES, "c2": head})
+
+    assert updated is None
+    assert calls == []
+
+
+def test_rewritten_history_falls_back_to_a_crawl():
+    repo = FakeRepository({"c1": BASE_FILES, "c2": dict(BASE_FILES, **{"src/util.js": "x"})})
+    base = evidence_at(repo, "c1")
+    repo.compare = lambda b, h: FakeRepository.compare(repo, b, h, status="diverged")
+
+    assert ai_utils.update_repo_evidence(repo, base, "c1", "c2") is None
+
+
+def test_file_grown_past_scan_size_falls_back_to_a_crawl(monkeypatch):
+    head = dict(BASE_FILES)
+    head["src/App.jsx"] = BASE_FILES["src/App.jsx"] + " " * 200
+    monkeypatch.setattr(ai_utils, "MAX_SCAN_SIZE", 150)
+    _, _, updated, _ = update({"c1": BASE_FILES, "c2": head})
+
+    assert updated is None
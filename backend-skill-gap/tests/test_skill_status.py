@@ -0,0 +1,108 @@
+"""
+Trend status marking (SkillStatusMatcher via utils._trends_with_status)
+compared with the substring checks generate_portfolio used before: the
+same results, except where raw substring containment matched unrelated
+skills ('java' in 'javascript', 'c' in 'c++').
+"""
+import pytest
+
+from skill_taxonomy import normalize_skill_name
+from utils import _trends_with_status
+
+
+def substring_status(trend, github_skills, user_skills, verified, no_evidence):
+    """The previous inline marking loop of generate_portfolio."""
+    def contains(skills):
+        t = normalize_skill_name(trend)
+        return any(
+            t == s or t in s or s in t for s in (normalize_skill_name(x) for x in skills)
+        )
+
+    is_in_github = contains(github_skills)
+    if contains(verified) or is_in_github:
+        return 'verified'
+    if contains(no_evidence) or (contains(user_skills) and not is_in_github):
+        return 'claimed_no_evidence'
+    return 'not_learned'
+
+
+def portfolio(trends, github_skills=(), user_skills=(), verified=(), no_evidence=()):
+    return {
+        'skills': list(user_skills),
+        'proficiency_analysis': {
+            'skills': [{'name': s, 'has_github_evidence': True} for s in github_skills],
+            'github_verified_skills': list(verified),
+            'claimed_no_evidence_skills': list(no_evidence),
+        },
+        'industry_trends': [{'skill': t} for t in trends],
+    }
+
+
+def statuses(data):
+    return {t['skill']: t['skill_status'] for t in _trends_with_status(data)}
+
+
+# (trend, github, claimed, verified, no evidence, expected status)
+SAME_AS_BEFORE = [
+    ("Python", ["python"], [], ["Python"], [], 'verified'),
+    ("HTML", [], ["html"], [], ["HTML"], 'claimed_no_evidence'),
+    ("Docker", [], [], [], [], 'not_learned'),
+    ("Spring Boot", ["Spring"], [], [], [], 'verified'),
+    ("Spring", [], ["Spring Boot"], [], [], 'claimed_no_evidence'),
+    ("Node.js", ["Node"], [], [], [], 'verified'),
+    ("Machine Learning", [], ["machine learning"], [], [], 'claimed_no_evidence'),
+    ("Learning", [], ["Machine Learning"], [], [], 'claimed_no_evidence'),
+    ("Deep Learning", [], [], [], ["deep learning models"], 'claimed_no_evidence'),
+    ("React Native", ["React"], [], [], [], 'verified'),
+    ("C++", ["c++"], [], [], [], 'verified'),
+    ("C", [], ["C"], [], [], 'claimed_no_evidence'),
+    ("Java", ["Java"], ["JavaScript"], [], [], 'verified'),
+]
+
+# Substring containment matched these; whole-word matching does not
+FIXED = [
+    ("Java", ["JavaScript"], [], [], [], 'verified', 'not_learned'),
+    ("JavaScript", [], ["Java"], [], [], 'claimed_no_evidence', 'not_learned'),
+    ("C", ["C++"], [], [], [], 'verified', 'not_learned'),
+    ("C++", [], ["C"], [], [], 'claimed_no_evidence', 'not_learned'),
+    ("C", [], ["C#"], [], [], 'claimed_no_evidence', 'not_learned'),
+    ("Go", ["Django"], [], [], [], 'verified', 'not_learned'),
+    ("SQL", [], ["NoSQL"], [], [], 'claimed_no_evidence', 'not_learned'),
+]
+
+
+@pytest.mark.parametrize("trend, github, claimed, verified, no_evidence, expected", SAME_AS_BEFORE)
+def test_status_matches_substring_marking(trend, github, claimed, verified, no_evidence, expected):
+    assert substring_status(trend, github, claimed, verified, no_evidence) == expected
+    assert statuses(portfolio([trend], github, claimed, verified, no_evidence)) == {trend: expected}
+
+
+@pytest.mark.parametrize("trend, github, claimed, verified, no_evidence, before, expected", FIXED)
+def test_whole_word_matching_drops_substring_false_positives(
+    trend, github, claimed, verified, no_evidence, before, expected
+):
+    assert substring_status(trend, github, claimed, verified, no_evidence) == before
+    assert statuses(portfolio([trend], github, claimed, verified, no_evidence)) == {trend: expected}
+
+
+def test_all_trends_marked_in_one_pass():
+    data = portfolio(
+        ["Java", "JavaScript", "C", "C++", "Spring Boot", "Kubernetes"],
+        github_skills=["JavaScript", "C++"],
+        user_skills=["Java", "Spring"],
+    )
+    assert statuses(data) == {
+        "Java": 'claimed_no_evidence',
+        "JavaScript": 'verified',
+        "C": 'not_learned',
+        "C++": 'verified',
+        "Spring Boot": 'claimed_no_evidence',
+        "Kubernetes": 'not_learned',
+    }
+    assert [t['has_skill'] for t in data['industry_trends']] == [True, True, False, True, True, False]
+
+
+def test_existing_status_is_kept():
+    data = portfolio(["Java"], github_skills=["Java"])
+    data['industry_trends'][0]['skill_status'] = 'not_learned'
+    assert statuses(data) == {"Java": 'not_learned'}
@@ -9,6 +9,8 @@ import os
 import tempfile
 import platform
 
+from skill_taxonomy import SkillStatusMatcher
+
 
 def get_temp_directory():
     """Get OS-appropriate temporary directory"""
@@ -26,6 +28,14 @@ def get_temp_directory():
     return temp_dir
 
 
+def _trends_with_status(data):
+    """Industry trends, filling in skill_status for payloads generated without it."""
+    trends = data.get('industry_trends', [])
+    if any(not t.get('skill_status') for t in trends):
+        SkillStatusMatcher.from_portfolio(data).mark_trends(trends, overwrite=False)
+    return trends
+
+
 def generate_resume_pdf(data):
     """Generate a professional resume PDF"""
     
@@ -183,7 +193,7 @@ def generate_resume_pdf(data):
         achievements.append("Active GitHub contributor with multiple repositories demonstrating real-world coding experience")
     
     # Add trending skills the user has
-    trends = data.get('industry_trends', [])
+    trends = _trends_with_status(data)
     trending_skills_owned = [t['skill'] for t in trends if t.get('skill_status') == 'verified']
     if trending_skills_owned:
         achievements.append(f"Proficient in trending technologies: {', '.join(trending_skills_owned[:3])}")
@@ -242,7 +252,7 @@ def generate_portfolio_html(data):
     proficiency = data.get('proficiency_analysis', {})
     roadmap = data.get('roadmap', {})
     jobs = data.get('job_opportunities', [])
-    trends = data.get('industry_trends', [])
+    trends = _trends_with_status(data)
     
     # Generate Skills HTML with verification status
     skills_html = ""